@@ -3,7 +3,13 @@ the IOT Agua platform of Micronova
 """
 
 import asyncio
+import contextlib
+import contextvars
 import copy
+from dataclasses import dataclass
+from functools import cached_property
+import heapq
+import itertools
 import jwt
 import logging
 import time
@@ -26,8 +32,35 @@ HEADER_ACCEPT = "application/json, text/javascript, */*; q=0.01"
 HEADER_CONTENT_TYPE = "application/json"
 HEADER = {"Accept": HEADER_ACCEPT, "Content-Type": HEADER_CONTENT_TYPE}
 
+# Assumed buffer read job latency until one has been measured.
+BUFFER_READ_JOB_DEFAULT_LATENCY = 5
+BUFFER_READ_JOB_EWMA_ALPHA = 0.3
+
+# Seconds between device list checks of the online state of the devices.
+DEVICE_ONLINE_REFRESH_INTERVAL = 300
+# Check more often while a device is offline, so its polling resumes quickly.
+DEVICE_OFFLINE_REFRESH_INTERVAL = 30
+
+# Operation priorities of a device, lowest value first.
+PRIORITY_WRITE = 0
+PRIORITY_VERIFY = 1
+PRIORITY_POLL = 2
+PRIORITY_NAMES = {
+    PRIORITY_WRITE: "write",
+    PRIORITY_VERIFY: "verify",
+    PRIORITY_POLL: "poll",
+}
+
+# The deadline of the update running in the current task, if any.
+_UPDATE_DEADLINE = contextvars.ContextVar("aguaiot_update_deadline", default=None)
+
 
 class aguaiot(object):
+    # Buffer reads only poll job status, so a write may cancel a running one.
+    preemptible_reads = True
+    # The device list tells whether the cloud can reach a device.
+    reports_online = True
+
     def __init__(
         self,
         api_url,
@@ -63,6 +96,22 @@ class aguaiot(object):
         self.http_timeout = http_timeout
         self.buffer_read_timeout = buffer_read_timeout
 
+        # Buffer read jobs submitted ahead of the next update, per device.
+        self._read_jobs = dict()
+        self._read_job_latency = None
+        self._read_job_stats = {
+            "prefetched": 0,
+            "hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "abandoned": 0,
+            "failed": 0,
+        }
+
+        # Monotonic time of the last device list, None to check on next update.
+        self._online_checked = None
+        self._online_stats = {"refreshes": 0, "refresh_errors": 0, "skipped_reads": 0}
+
         # Vendor specific fixes
         self.air_temp_fix = air_temp_fix
         self.reading_error_fix = reading_error_fix
@@ -92,6 +141,9 @@ class aguaiot(object):
 
         return headers
 
+    async def close(self):
+        """Nothing to close, the HTTP client is shared with Home Assistant."""
+
     async def register_app_id(self):
         """Register app id with Agua IOT"""
 
@@ -247,6 +299,8 @@ class aguaiot(object):
         if res is False:
             raise AguaIOTError("Error while fetching devices")
 
+        known = {dev.id_device: dev for dev in self.devices}
+        devices = []
         for dev in res["device"]:
             url = self.api_url + API_PATH_DEVICE_INFO
 
@@ -255,7 +309,23 @@ class aguaiot(object):
             if res2 is False:
                 raise AguaIOTError("Error while fetching device info")
 
-            self.devices.append(
+            existing = known.get(dev["id_device"])
+            if existing is not None:
+                # Keep the Device object entities already hold a reference to.
+                existing.update_metadata(
+                    dev["id"],
+                    dev["id_product"],
+                    dev["product_serial"],
+                    dev["name"],
+                    dev["is_online"],
+                    dev["name_product"],
+                    res2["device_info"][0]["id_registers_map"],
+                    device_info=res2["device_info"][0],
+                )
+                devices.append(existing)
+                continue
+
+            devices.append(
                 Device(
                     dev["id"],
                     dev["id_device"],
@@ -270,18 +340,96 @@ class aguaiot(object):
                 )
             )
 
+        self.devices = devices
+        self._online_checked = time.monotonic()
+
+    async def refresh_online_status(self):
+        """Update the online state of the known devices from the device list.
+
+        A single call, without the per device info calls of `fetch_devices`.
+        """
+        url = self.api_url + API_PATH_DEVICE_LIST
+
+        res = await self.handle_webcall("POST", url, {})
+        if res is False:
+            raise AguaIOTError("Error while fetching devices")
+
+        self._online_checked = time.monotonic()
+        self._online_stats["refreshes"] += 1
+        online = {dev["id_device"]: dev["is_online"] for dev in res["device"]}
+        for dev in self.devices:
+            if dev.id_device not in online:
+                continue
+            if bool(online[dev.id_device]) != bool(dev.is_online):
+                _LOGGER.info(
+                    "%s is %s",
+                    dev.name,
+                    "back online" if online[dev.id_device] else "offline",
+                )
+            dev.set_online(online[dev.id_device])
+
+    def _online_refresh_due(self):
+        """Return True when the online state of the devices should be checked."""
+        if self._online_checked is None:
+            return True
+
+        interval = (
+            DEVICE_ONLINE_REFRESH_INTERVAL
+            if all(dev.is_online for dev in self.devices)
+            else DEVICE_OFFLINE_REFRESH_INTERVAL
+        )
+        return time.monotonic() - self._online_checked >= interval
+
+    @property
+    def online_stats(self):
+        """Return the device list refreshes and the reads skipped while offline."""
+        return dict(self._online_stats)
+
+    def load_cached_devices(self, cached_devices):
+        """Restore devices from a previously exported cache, without network access"""
+        self.devices = [Device.from_cache(entry, self) for entry in cached_devices]
+
     async def fetch_device_information(self):
         """Fetch device information of heating devices"""
         for dev in self.devices:
             await dev.update_mapping()
 
     async def update(self):
+        """Read the devices the cloud reports online.
+
+        Buffer reads of an offline device would only wait for their timeout,
+        so those devices are skipped until the device list has them back.
+        """
+        if self._online_refresh_due():
+            try:
+                with deadline_stage("online refresh"):
+                    await self.refresh_online_status()
+            except AguaIOTError as e:
+                # The buffer reads still work without the device list.
+                _LOGGER.debug("Keeping the last known online state: %s", e)
+                self._online_checked = time.monotonic()
+                self._online_stats["refresh_errors"] += 1
+
         for dev in self.devices:
-            await dev.update()
+            if not dev.is_online:
+                self._online_stats["skipped_reads"] += 1
+                continue
+            try:
+                await dev.update()
+            except AguaIOTError:
+                # The device may have gone offline, check before the next read.
+                self._online_checked = None
+                raise
 
     async def handle_webcall(self, method, url, payload):
-        if time.time() > self.token_expires:
-            await self.do_refresh_token()
+        if self.token is None:
+            # Devices restored from cache are used before the first login.
+            with deadline_stage("login"):
+                await self.register_app_id()
+                await self.login()
+        elif self.token_expires is not None and time.time() > self.token_expires:
+            with deadline_stage("token refresh"):
+                await self.do_refresh_token()
 
         extra_headers = {"local": "false", "Authorization": self.token}
 
@@ -297,7 +445,7 @@ class aguaiot(object):
                         json=payload,
                         headers=headers,
                         follow_redirects=False,
-                        timeout=self.http_timeout,
+                        timeout=deadline_timeout(self.http_timeout),
                     )
             else:
                 async with self.async_client as client:
@@ -306,7 +454,7 @@ class aguaiot(object):
                         params=payload,
                         headers=headers,
                         follow_redirects=False,
-                        timeout=self.http_timeout,
+                        timeout=deadline_timeout(self.http_timeout),
                     )
             _LOGGER.debug(
                 "RESPONSE %s - CODE: %s DATA: %s",
@@ -318,7 +466,8 @@ class aguaiot(object):
             raise AguaIOTConnectionError(f"Connection error to {url}: {e}")
 
         if response.status_code == 401:
-            await self.do_refresh_token()
+            with deadline_stage("token refresh"):
+                await self.do_refresh_token()
             return await self.handle_webcall(method, url, payload)
         elif response.status_code != 200:
             _LOGGER.error(
@@ -353,8 +502,84 @@ class aguaiot(object):
 
         return registers
 
+    async def prefetch_device_information(self):
+        """Submit buffer read jobs now, for the next update to collect.
+
+        The module answers the job while the update is not due yet, taking
+        the job latency off the update. Jobs are submitted through the
+        operation queue of the device, so none is submitted while a write
+        runs and then collected as if it were newer.
+        """
+        for dev in self.devices:
+            if dev.id_device in self._read_jobs or not dev.is_online:
+                continue
+            await dev.prefetch()
+
+    async def _prefetch_device_information(self, device):
+        """Submit a buffer read job for the next update of a device."""
+        if device.id_device in self._read_jobs:
+            return
+        try:
+            id_request = await self._submit_buffer_read(device)
+        except AguaIOTError as e:
+            _LOGGER.debug("Prefetching buffer read of %s failed: %s", device.name, e)
+            return
+        self._read_jobs[device.id_device] = (id_request, time.monotonic())
+        self._read_job_stats["prefetched"] += 1
+
+    @property
+    def read_job_lead(self):
+        """Return how long before an update its buffer read should be submitted."""
+        latency = self._read_job_latency or BUFFER_READ_JOB_DEFAULT_LATENCY
+        return min(latency, self.buffer_read_timeout) + 1
+
+    @property
+    def read_job_stats(self):
+        """Return prefetched buffer read job counts and the job latency."""
+        return {
+            **self._read_job_stats,
+            "avg_latency": round(self._read_job_latency, 3)
+            if self._read_job_latency is not None
+            else None,
+        }
+
     async def _fetch_device_information(self, device):
-        """Fetch current register values for a device."""
+        """Fetch current register values for a device.
+
+        Uses the prefetched buffer read job of the device when there is a
+        recent one, and submits a new job otherwise.
+        """
+        job = self._read_jobs.pop(device.id_device, None)
+        if job is not None:
+            id_request, submitted = job
+            # An older job was not collected on time and its values are stale.
+            if time.monotonic() - submitted > 2 * self.read_job_lead:
+                self._read_job_stats["expired"] += 1
+            else:
+                # The job has probably completed already, so check right away.
+                res = await self._await_buffer_read(id_request, sleep_secs=0)
+                if res and res.get("jobAnswerStatus") == "completed":
+                    self._read_job_stats["hits"] += 1
+                    return self._parse_buffer_read(res)
+
+                _LOGGER.debug(
+                    "Prefetched buffer read (%s) ended with status %s, reading again",
+                    id_request,
+                    res.get("jobAnswerStatus") if res else res,
+                )
+                self._read_job_stats["failed"] += 1
+        else:
+            self._read_job_stats["misses"] += 1
+
+        submitted = time.monotonic()
+        id_request = await self._submit_buffer_read(device)
+        res = await self._await_buffer_read(id_request)
+        if res and res.get("jobAnswerStatus") == "completed":
+            self._record_read_job_latency(time.monotonic() - submitted)
+        return self._parse_buffer_read(res)
+
+    async def _submit_buffer_read(self, device):
+        """Request a buffer read job for a device and return its request id."""
         url = self.api_url + API_PATH_DEVICE_BUFFER_READING
 
         payload = {
@@ -363,13 +588,18 @@ class aguaiot(object):
             "BufferId": 1,
         }
 
-        res_req = await self.handle_webcall("POST", url, payload)
+        with deadline_stage("buffer read request"):
+            res_req = await self.handle_webcall("POST", url, payload)
         if res_req is False:
             raise AguaIOTError("Error while making device buffer read request.")
 
-        async def buffer_read_loop(id_request):
+        return res_req["idRequest"]
+
+    async def _await_buffer_read(self, id_request, sleep_secs=1):
+        """Poll a buffer read job until it is no longer waiting."""
+
+        async def buffer_read_loop(id_request, sleep_secs):
             url = self.api_url + API_PATH_DEVICE_JOB_STATUS + id_request
-            sleep_secs = 1
             attempts = 1
 
             try:
@@ -378,6 +608,8 @@ class aguaiot(object):
 
                     _LOGGER.debug("BUFFER READ (%s) ATTEMPT %s", id_request, attempts)
                     res_get = await self.handle_webcall("GET", url, {})
+                    if res_get is False:
+                        return res_get
                     _LOGGER.debug(
                         "BUFFER READ (%s) STATUS: %s",
                         id_request,
@@ -392,15 +624,18 @@ class aguaiot(object):
                 raise
 
         try:
-            res = await asyncio.wait_for(
-                buffer_read_loop(res_req["idRequest"]),
-                self.buffer_read_timeout,
-            )
+            with deadline_stage("buffer read job"):
+                return await asyncio.wait_for(
+                    buffer_read_loop(id_request, sleep_secs),
+                    deadline_timeout(self.buffer_read_timeout),
+                )
         except asyncio.TimeoutError:
             raise AguaIOTUpdateError(
                 f"Timeout on waiting device buffer read to complete within {self.buffer_read_timeout} seconds."
             )
 
+    def _parse_buffer_read(self, res):
+        """Return the register values of a finished buffer read job."""
         if not res:
             raise AguaIOTUpdateError("Error while reading device buffer response.")
 
@@ -422,10 +657,23 @@ class aguaiot(object):
             f"Received unexpected 'jobAnswerStatus' while reading buffers: {res.get('jobAnswerStatus')}"
         )
 
+    def _record_read_job_latency(self, elapsed):
+        """Update the average time for a buffer read job to complete."""
+        if self._read_job_latency is None:
+            self._read_job_latency = elapsed
+        else:
+            self._read_job_latency += BUFFER_READ_JOB_EWMA_ALPHA * (
+                elapsed - self._read_job_latency
+            )
+
     async def _request_writing(self, device, items):
         """Write raw register values for a device."""
         url = self.api_url + API_PATH_DEVICE_WRITING
 
+        # A prefetched read may predate the write, so read again next update.
+        if self._read_jobs.pop(device.id_device, None) is not None:
+            self._read_job_stats["abandoned"] += 1
+
         set_items = []
         set_masks = []
         set_bits = []
@@ -477,6 +725,204 @@ class aguaiot(object):
             raise AguaIOTError("Error while request device writing")
 
 
+class UpdateDeadline(object):
+    """Time budget of one update, shared by every stage it runs.
+
+    Used as an async context manager around the update. Web calls, buffer
+    read jobs and Bluetooth steps cut their own timeouts to the remaining
+    budget. When the budget runs out the update is cancelled and
+    `AguaIOTDeadlineExceeded` names the stage that was running.
+    """
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.expires = None
+        self.active = False
+        self.stages = dict()
+        self.expired_stage = None
+        self._token = None
+        self._timeout = None
+
+    def remaining(self):
+        """Return the seconds left of the budget."""
+        return max(0.0, self.expires - time.monotonic())
+
+    async def __aenter__(self):
+        self.expires = time.monotonic() + self.budget
+        self.active = True
+        self._token = _UPDATE_DEADLINE.set(self)
+        self._timeout = asyncio.timeout(self.budget)
+        await self._timeout.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        # Tasks started during the update keep a copy of the context.
+        self.active = False
+        _UPDATE_DEADLINE.reset(self._token)
+        try:
+            await self._timeout.__aexit__(exc_type, exc, tb)
+        except TimeoutError as err:
+            raise AguaIOTDeadlineExceeded(self._message()) from err
+
+        if (
+            isinstance(exc, AguaIOTError)
+            and not isinstance(exc, AguaIOTDeadlineExceeded)
+            and self.remaining() <= 0
+        ):
+            # A step failed because its timeout was cut to the budget.
+            raise AguaIOTDeadlineExceeded(self._message()) from exc
+
+    def _message(self):
+        stages = ", ".join(
+            f"{stage} {seconds:.1f} s"
+            for stage, seconds in sorted(
+                self.stages.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+        return (
+            f"Update did not finish within {self.budget} seconds while in "
+            f"'{self.expired_stage or 'unknown'}' (time per stage: {stages or 'none'})."
+        )
+
+
+@contextlib.contextmanager
+def deadline_stage(name):
+    """Account the time of one update stage to the running deadline."""
+    deadline = _UPDATE_DEADLINE.get()
+    if deadline is None or not deadline.active:
+        yield
+        return
+
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        deadline.stages[name] = (
+            deadline.stages.get(name, 0.0) + time.monotonic() - started
+        )
+        if deadline.expired_stage is None and deadline.remaining() <= 0:
+            deadline.expired_stage = name
+
+
+def deadline_timeout(timeout):
+    """Return a timeout cut to the remaining budget of the running update."""
+    deadline = _UPDATE_DEADLINE.get()
+    if deadline is None or not deadline.active:
+        return timeout
+    return min(timeout, deadline.remaining())
+
+
+class OperationScheduler(object):
+    """Run the operations of one device one at a time, by priority.
+
+    Waiting writes go first, then verification reads, then polls. A write
+    also cancels a running preemptible poll, which then raises
+    `AguaIOTPreempted`.
+    """
+
+    def __init__(self):
+        self._busy = False
+        self._waiters = []
+        self._order = itertools.count()
+        self._running = None
+        self._preempted = None
+        self._stats = {
+            priority: {"count": 0, "wait": 0.0, "max_wait": 0.0, "preempted": 0}
+            for priority in PRIORITY_NAMES
+        }
+
+    async def run(self, priority, operation, preemptible=False):
+        """Run `operation()` once the operations before it are done."""
+        started = time.monotonic()
+        if self._busy:
+            if priority == PRIORITY_WRITE:
+                self._preempt()
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._order), future))
+            try:
+                with deadline_stage("queue wait"):
+                    await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # Cancelled right after being handed the turn; pass it on.
+                    self._release()
+                raise
+        self._busy = True
+        self._record_wait(priority, time.monotonic() - started)
+
+        try:
+            if not preemptible:
+                return await operation()
+
+            task = asyncio.ensure_future(operation())
+            self._running = task
+            try:
+                return await task
+            except asyncio.CancelledError:
+                if self._preempted is not task:
+                    raise
+                self._stats[priority]["preempted"] += 1
+                raise AguaIOTPreempted("Operation preempted by a write.")
+        finally:
+            self._running = None
+            self._preempted = None
+            self._release()
+
+    def _preempt(self):
+        """Cancel the running preemptible operation."""
+        if self._running is not None and not self._running.done():
+            self._preempted = self._running
+            self._running.cancel()
+
+    def _release(self):
+        """Hand the turn to the first waiting operation."""
+        while self._waiters:
+            future = heapq.heappop(self._waiters)[2]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._busy = False
+
+    def _record_wait(self, priority, wait):
+        stats = self._stats[priority]
+        stats["count"] += 1
+        stats["wait"] += wait
+        stats["max_wait"] = max(stats["max_wait"], wait)
+
+    @property
+    def stats(self):
+        """Return the queue wait per priority class."""
+        return {
+            PRIORITY_NAMES[priority]: {
+                "count": stats["count"],
+                "avg_wait": round(stats["wait"] / stats["count"], 3)
+                if stats["count"]
+                else None,
+                "max_wait": round(stats["max_wait"], 3),
+                "preempted": stats["preempted"],
+            }
+            for priority, stats in self._stats.items()
+        }
+
+
+@dataclass(frozen=True)
+class DeviceSnapshot:
+    """Immutable register values and availability of a device.
+
+    The generation only changes when the values, the register map or the
+    online state change, so equal snapshots mean nothing changed for the
+    entities of the device.
+    """
+
+    generation: int
+    values: tuple = ()
+    available: bool = True
+
+    @cached_property
+    def information(self):
+        return dict(self.values)
+
+
 class Device(object):
     """Agua IOT heating device representation"""
 
@@ -505,15 +951,116 @@ class Device(object):
         self.__aguaiot = aguaiot
         self.__device_info = device_info or dict()
         self.__register_map_dict = register_map or dict()
-        self.__information_dict = dict()
+        self.__register_keys = frozenset(self.__register_map_dict)
+        self.__snapshot = DeviceSnapshot(0, available=self.available)
+        self.__used_registers = set()
+        self.__read_registers = set()
+        self.__scheduler = OperationScheduler()
+        self.__verify_pending = False
+
+    @classmethod
+    def from_cache(cls, entry, aguaiot):
+        """Create a device from an `export_cache()` entry."""
+        return cls(
+            entry["id"],
+            entry["id_device"],
+            entry["id_product"],
+            entry["product_serial"],
+            entry["name"],
+            entry["is_online"],
+            entry["name_product"],
+            entry["id_registers_map"],
+            aguaiot,
+            device_info=entry.get("device_info"),
+            register_map=entry.get("register_map"),
+        )
+
+    def update_metadata(
+        self,
+        id,
+        id_product,
+        product_serial,
+        name,
+        is_online,
+        name_product,
+        id_registers_map,
+        device_info=None,
+    ):
+        self.id = id
+        self.id_product = id_product
+        self.product_serial = product_serial
+        self.name = name
+        self.set_online(is_online)
+        self.name_product = name_product
+        self.id_registers_map = id_registers_map
+        self.__device_info = device_info or dict()
 
     async def update_mapping(self):
         self.__register_map_dict = await self.__aguaiot._fetch_device_registers_mapping(
             self
         )
+        self.__register_keys = frozenset(self.__register_map_dict)
+        self.__snapshot = DeviceSnapshot(
+            self.__snapshot.generation + 1,
+            self.__snapshot.values,
+            self.__snapshot.available,
+        )
+
+    async def prefetch(self):
+        """Submit a buffer read ahead of the next update, queued like a poll."""
+        await self.__scheduler.run(
+            PRIORITY_POLL,
+            lambda: self.__aguaiot._prefetch_device_information(self),
+        )
 
     async def update(self):
-        self.__information_dict = await self.__aguaiot._fetch_device_information(self)
+        """Read the register values, after pending writes.
+
+        The first read after a write verifies it and goes before polls. A
+        poll preempted by a write keeps the current values.
+        """
+        priority = PRIORITY_VERIFY if self.__verify_pending else PRIORITY_POLL
+        try:
+            information = await self.__scheduler.run(
+                priority,
+                lambda: self.__aguaiot._fetch_device_information(self),
+                preemptible=priority == PRIORITY_POLL
+                and getattr(self.__aguaiot, "preemptible_reads", False),
+            )
+        except AguaIOTPreempted:
+            return
+
+        self.__verify_pending = False
+        self.set_information(information)
+
+    @property
+    def queue_stats(self):
+        """Return the operation queue wait per priority class."""
+        return self.__scheduler.stats
+
+    def set_online(self, is_online):
+        """Set the online state, starting a new generation on change."""
+        changed = bool(is_online) != bool(self.is_online)
+        self.is_online = is_online
+        if changed:
+            self.__snapshot = DeviceSnapshot(
+                self.__snapshot.generation + 1, self.__snapshot.values, self.available
+            )
+
+    @property
+    def available(self):
+        """Return False while the cloud reports the device offline."""
+        return bool(self.is_online) or not getattr(
+            self.__aguaiot, "reports_online", False
+        )
+
+    def set_information(self, information):
+        """Replace the register values, starting a new generation on change."""
+        values = tuple(sorted(information.items()))
+        if values != self.__snapshot.values:
+            self.__snapshot = DeviceSnapshot(
+                self.__snapshot.generation + 1, values, self.__snapshot.available
+            )
 
     def __prepare_value_for_writing(self, item, value, limit_value_raw=False):
         set_min = self.__register_map_dict[item]["set_min"]
@@ -542,12 +1089,20 @@ class Device(object):
         return value
 
     async def __request_writing(self, items):
-        await self.__aguaiot._request_writing(self, items)
+        await self.__scheduler.run(
+            PRIORITY_WRITE, lambda: self.__aguaiot._request_writing(self, items)
+        )
+        self.__verify_pending = True
 
     @property
     def registers(self):
         return list(self.__register_map_dict.keys())
 
+    @property
+    def register_keys(self):
+        """Return the register keys as a set, rebuilt only when the map changes."""
+        return self.__register_keys
+
     @property
     def device_info_data(self):
         return self.__device_info
@@ -563,8 +1118,8 @@ class Device(object):
     def export_register_map(self):
         return copy.deepcopy(self.__register_map_dict)
 
-    def export_cache(self):
-        return {
+    def export_cache(self, register_map=True):
+        cache = {
             "id": self.id,
             "id_device": self.id_device,
             "id_product": self.id_product,
@@ -574,15 +1129,35 @@ class Device(object):
             "name_product": self.name_product,
             "id_registers_map": self.id_registers_map,
             "device_info": copy.deepcopy(self.__device_info),
-            "register_map": self.export_register_map(),
         }
+        if register_map:
+            cache["register_map"] = self.export_register_map()
+        return cache
+
+    @property
+    def snapshot(self):
+        return self.__snapshot
+
+    @property
+    def generation(self):
+        return self.__snapshot.generation
 
-    def get_register(self, key):
+    def export_information(self):
+        return dict(self.__snapshot.information)
+
+    def restore_information(self, information):
+        self.set_information(
+            {int(offset): value for offset, value in information.items()}
+        )
+
+    def get_register(self, key, snapshot=None):
         register = self.__register_map_dict.get(key, {})
+        if snapshot is None:
+            snapshot = self.__snapshot
 
         try:
             register["value_raw"] = str(
-                self.__information_dict[register["offset"]] & register["mask"]
+                snapshot.information[register["offset"]] & register["mask"]
             )
 
             formula = register["formula"].replace("#", register["value_raw"])
@@ -599,13 +1174,35 @@ class Device(object):
 
         return register
 
-    def get_register_value(self, key):
-        value = self.get_register(key).get("value")
+    @property
+    def used_offsets(self):
+        """Offsets of the registers whose values entities have read."""
+        return {
+            self.__register_map_dict[key]["offset"]
+            for key in self.__used_registers | self.__read_registers
+            if "offset" in self.__register_map_dict.get(key, {})
+        }
+
+    def reset_used_registers(self):
+        """Keep only the registers entities read since the last reset.
+
+        Entities read their registers whenever new values are published, so
+        a register no entity read in that time is no longer used. Without
+        any read since the last reset, the used registers are kept.
+        """
+        if self.__read_registers:
+            self.__used_registers = self.__read_registers
+            self.__read_registers = set()
+
+    def get_register_value(self, key, snapshot=None):
+        self.__read_registers.add(key)
+        register = self.get_register(key, snapshot)
+        value = register.get("value")
 
         # Fix for reading errors from wifi module
         if (
             self.__aguaiot.reading_error_fix
-            and int(self.get_register(key).get("value_raw", 0)) == 32768
+            and int(register.get("value_raw", 0)) == 32768
         ):
             _LOGGER.debug(
                 f"Applied reading_error_fix. Dropped value {value} for register {key}"
@@ -632,20 +1229,18 @@ class Device(object):
     def get_register_value_max(self, key):
         return self.get_register(key).get("set_max")
 
-    def get_register_value_formatted(self, key):
-        return str.format(
-            self.get_register(key).get("format_string"),
-            self.get_register(key).get("value"),
-        )
+    def get_register_value_formatted(self, key, snapshot=None):
+        self.__read_registers.add(key)
+        register = self.get_register(key, snapshot)
+        return str.format(register.get("format_string"), register.get("value"))
 
-    def get_register_value_description(self, key, language=None):
+    def get_register_value_description(self, key, language=None, snapshot=None):
         options = self.get_register_value_options(key, language)
+        value = self.get_register_value(key, snapshot)
         if options:
-            return options.get(
-                self.get_register_value(key), self.get_register_value(key)
-            )
+            return options.get(value, value)
         else:
-            return self.get_register_value(key)
+            return value
 
     def get_register_value_options(self, key, language=None):
         if "enc_val" in self.get_register(key):
@@ -665,9 +1260,9 @@ class Device(object):
             return {item["lang"] for item in self.get_register(key).get("enc_val")}
         return set()
 
-    def get_register_enabled(self, key):
+    def get_register_enabled(self, key, snapshot=None):
         enable_key = key.rsplit("_", 1)[0] + "_enable"
-        if enable_key not in self.registers or not self.get_register(enable_key):
+        if enable_key not in self.register_keys or not self.get_register(enable_key):
             # Always enabled if no enable register present
             return True
 
@@ -678,9 +1273,9 @@ class Device(object):
             enabled_values = [
                 d["value"] for d in self.get_register(enable_key).get("enable_val")
             ]
-            return self.get_register_value(enable_key) in enabled_values
+            return self.get_register_value(enable_key, snapshot) in enabled_values
         else:
-            return self.get_register_value(enable_key) == 1
+            return self.get_register_value(enable_key, snapshot) == 1
 
     async def set_register_value(self, key, value, limit_value_raw=False):
         if value is None:
@@ -755,3 +1350,17 @@ class AguaIOTUpdateError(AguaIOTError):
 
     def __init__(self, message):
         super().__init__(message)
+
+
+class AguaIOTPreempted(AguaIOTError):
+    """Operation preempted by a write"""
+
+    def __init__(self, message):
+        super().__init__(message)
+
+
+class AguaIOTDeadlineExceeded(AguaIOTUpdateError):
+    """Update deadline exceeded"""
+
+    def __init__(self, message):
+        super().__init__(message)
@@ -12,11 +12,11 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     sensors = []
     for device in agua.devices:
-        hybrid = "power_wood_set" in device.registers
+        hybrid = "power_wood_set" in device.register_keys
 
         for sensor in BINARY_SENSORS:
             if (
-                sensor.key in device.registers
+                sensor.key in device.register_keys
                 and (sensor.force_enabled or device.get_register_enabled(sensor.key))
                 and (not sensor.hybrid_only or hybrid)
             ):
@@ -63,7 +63,21 @@ class AguaIOTHeatingBinarySensor(CoordinatorEntity, BinarySensorEntity):
             model=self._device.name_product,
         )
 
+    @property
+    def _snapshot(self):
+        """Return the device values the coordinator published last."""
+        return self.coordinator.data[self._device.id_device]
+
+    @property
+    def available(self):
+        """Return False while the stove is offline."""
+        return super().available and self._snapshot.available
+
     @property
     def is_on(self):
         """Return the state of the sensor."""
-        return bool(self._device.get_register_value(self.entity_description.key))
+        return bool(
+            self._device.get_register_value(
+                self.entity_description.key, snapshot=self._snapshot
+            )
+        )
@@ -1,8 +1,9 @@
 """Support for Agua IOT heating devices."""
 
 import logging
+import dataclasses
+import functools
 import re
-import copy
 import numbers
 from homeassistant.helpers import entity_platform
 from homeassistant.util import dt
@@ -36,6 +37,64 @@ from .aguaiot import AguaIOTError
 _LOGGER = logging.getLogger(__name__)
 
 
+def _compile_canalizations(canalizations):
+    """Combine all canalization patterns into one regex.
+
+    Every pattern is wrapped in a `c<index>` group and its own named groups are
+    prefixed with `c<index>_`, so one match tells which description matched.
+    """
+    patterns = []
+    for index, canalization in enumerate(canalizations):
+        pattern = re.sub(r"\(\?P<(\w+)>", rf"(?P<c{index}_\1>", canalization.key)
+        patterns.append(f"(?P<c{index}>{pattern})")
+    return re.compile("|".join(patterns))
+
+
+CANALIZATIONS_RE = _compile_canalizations(CLIMATE_CANALIZATIONS)
+
+
+def _match_canalizations(device):
+    """Return (description, register key, named groups) for every canalization."""
+    found = [[] for _ in CLIMATE_CANALIZATIONS]
+    for register in device.registers:
+        match = CANALIZATIONS_RE.match(register)
+        if not match:
+            continue
+
+        prefix = f"{match.lastgroup}_"
+        groups = {
+            name[len(prefix) :]: value
+            for name, value in match.groupdict().items()
+            if name.startswith(prefix)
+        }
+        found[int(match.lastgroup[1:])].append((match.group(0), groups))
+
+    return [
+        (canalization, key, groups)
+        for canalization, matches in zip(CLIMATE_CANALIZATIONS, found)
+        for key, groups in matches
+    ]
+
+
+def _cached_per_generation(func):
+    """Cache a computed value until the coordinator snapshot generation changes."""
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self):
+        generation = self._snapshot.generation
+        if self._cache_generation != generation:
+            self._cache = {}
+            self._cache_generation = generation
+        try:
+            return self._cache[name]
+        except KeyError:
+            value = self._cache[name] = func(self)
+            return value
+
+    return wrapper
+
+
 async def async_setup_entry(hass, config_entry, async_add_entities):
     coordinator = config_entry.runtime_data
     agua = coordinator.agua
@@ -45,53 +104,46 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         stove = AguaIOTAirDevice(coordinator, device)
         entities.append(stove)
 
-        if any(f"temp_{variant}_set" in device.registers for variant in WATER_VARIANTS):
+        if any(
+            f"temp_{variant}_set" in device.register_keys for variant in WATER_VARIANTS
+        ):
             entities.append(AguaIOTWaterDevice(coordinator, device, stove))
 
-        for canalization in CLIMATE_CANALIZATIONS:
-            for c_found in [
-                m
-                for i in device.registers
-                for m in [re.match(canalization.key, i.lower())]
-                if m
-            ]:
-                if (
-                    (
-                        canalization.key_enable
-                        and device.get_register_enabled(
-                            canalization.key_enable.format(id=c_found.group(1))
-                        )
-                    )
-                    or (
-                        canalization.key2_enable
-                        and device.get_register_enabled(
-                            canalization.key2_enable.format(id=c_found.group(1))
-                        )
+        for canalization, c_key, c_groups in _match_canalizations(device):
+            if (
+                (
+                    canalization.key_enable
+                    and device.get_register_enabled(
+                        canalization.key_enable.format(id=c_groups.get("id"))
                     )
-                    or (
-                        not canalization.key_enable
-                        and device.get_register_enabled(c_found.group(0))
+                )
+                or (
+                    canalization.key2_enable
+                    and device.get_register_enabled(
+                        canalization.key2_enable.format(id=c_groups.get("id"))
                     )
-                ):
-                    c_copy = copy.deepcopy(canalization)
-                    c_copy.key = c_found.group(0)
-                    for key in [
-                        "name",
-                        "key_temp_set",
-                        "key_temp_get",
-                        "key_temp2_get",
-                        "key_vent_set",
-                    ]:
-                        if getattr(c_copy, key):
-                            setattr(
-                                c_copy,
-                                key,
-                                getattr(c_copy, key).format_map(c_found.groupdict()),
-                            )
-
-                    entities.append(
-                        AguaIOTCanalizationDevice(coordinator, device, c_copy, stove)
+                )
+                or (not canalization.key_enable and device.get_register_enabled(c_key))
+            ):
+                changes = {"key": c_key}
+                for key in [
+                    "name",
+                    "key_temp_set",
+                    "key_temp_get",
+                    "key_temp2_get",
+                    "key_vent_set",
+                ]:
+                    if getattr(canalization, key):
+                        changes[key] = getattr(canalization, key).format_map(c_groups)
+
+                entities.append(
+                    AguaIOTCanalizationDevice(
+                        coordinator,
+                        device,
+                        dataclasses.replace(canalization, **changes),
+                        stove,
                     )
+                )
 
     async_add_entities(entities, True)
 
@@ -104,6 +156,8 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
 
 class AguaIOTClimateDevice(CoordinatorEntity, ClimateEntity):
+    _cache_generation = None
+
     @property
     def device_info(self):
         """Return the device info."""
@@ -114,6 +168,16 @@ class AguaIOTClimateDevice(CoordinatorEntity, ClimateEntity):
             model=self._device.name_product,
         )
 
+    @property
+    def _snapshot(self):
+        """Return the device values the coordinator published last."""
+        return self.coordinator.data[self._device.id_device]
+
+    @property
+    def available(self):
+        """Return False while the stove is offline."""
+        return super().available and self._snapshot.available
+
     @property
     def temperature_unit(self):
         """Return the unit of measurement."""
@@ -136,14 +200,18 @@ class AguaIOTAirDevice(AguaIOTClimateDevice):
         super().__init__(coordinator)
         self._enable_turn_on_off_backwards_compatibility = False
         self._device = device
-        self._hybrid = "power_wood_set" in device.registers
+        self._hybrid = "power_wood_set" in device.register_keys
 
         self._temperature_get_key = None
         for variant in AIR_VARIANTS:
             if (
-                f"temp_{variant}_get" in self._device.registers
-                and self._device.get_register_enabled(f"temp_{variant}_get")
-                and self._device.get_register_value(f"temp_{variant}_get")
+                f"temp_{variant}_get" in self._device.register_keys
+                and self._device.get_register_enabled(
+                    f"temp_{variant}_get", snapshot=self._snapshot
+                )
+                and self._device.get_register_value(
+                    f"temp_{variant}_get", snapshot=self._snapshot
+                )
             ):
                 self._temperature_get_key = f"temp_{variant}_get"
                 break
@@ -151,21 +219,28 @@ class AguaIOTAirDevice(AguaIOTClimateDevice):
         self._temperature_set_key = None
         for variant in AIR_VARIANTS:
             if (
-                f"temp_{variant}_set" in self._device.registers
-                and self._device.get_register_enabled(f"temp_{variant}_set")
-                and self._device.get_register_value(f"temp_{variant}_set")
+                f"temp_{variant}_set" in self._device.register_keys
+                and self._device.get_register_enabled(
+                    f"temp_{variant}_set", snapshot=self._snapshot
+                )
+                and self._device.get_register_value(
+                    f"temp_{variant}_set", snapshot=self._snapshot
+                )
             ):
                 self._temperature_set_key = f"temp_{variant}_set"
                 break
 
+    @_cached_per_generation
     def _status_description_upper(self):
         """Return the current status description in a normalized uppercase form."""
-        status_value = self._device.get_register_value("status_get")
+        status_value = self._device.get_register_value(
+            "status_get", snapshot=self._snapshot
+        )
         if status_value is None:
             return None
 
         description = self._device.get_register_value_description(
-            key="status_get", language="ENG"
+            key="status_get", language="ENG", snapshot=self._snapshot
         )
         if description is None:
             return None
@@ -199,9 +274,12 @@ class AguaIOTAirDevice(AguaIOTClimateDevice):
         return features
 
     @property
+    @_cached_per_generation
     def hvac_action(self):
         """Return the current running hvac operation."""
-        status_value = self._device.get_register_value("status_get")
+        status_value = self._device.get_register_value(
+            "status_get", snapshot=self._snapshot
+        )
         if status_value is not None:
             description = self._status_description_upper()
             if self._is_alarm_like_status():
@@ -218,9 +296,12 @@ class AguaIOTAirDevice(AguaIOTClimateDevice):
         return [HVACMode.HEAT, HVACMode.OFF]
 
     @property
+    @_cached_per_generation
     def hvac_mode(self):
         """Return hvac operation ie. heat, cool mode."""
-        status_value = self._device.get_register_value("status_get")
+        status_value = self._device.get_register_value(
+            "status_get", snapshot=self._snapshot
+        )
         if status_value is not None:
             description = self._status_description_upper()
             if (
@@ -242,19 +323,28 @@ class AguaIOTAirDevice(AguaIOTClimateDevice):
     def hybrid_mode(self):
         return (
             MODE_WOOD
-            if self._hybrid and self._device.get_register_enabled("real_power_wood_get")
+            if self._hybrid
+            and self._device.get_register_enabled(
+                "real_power_wood_get", snapshot=self._snapshot
+            )
             else MODE_PELLETS
         )
 
     @property
+    @_cached_per_generation
     def fan_mode(self):
         """Return fan mode."""
         power_register = (
             "power_wood_set" if self.hybrid_mode == MODE_WOOD else "power_set"
         )
-        return str(self._device.get_register_value_description(power_register))
+        return str(
+            self._device.get_register_value_description(
+                power_register, snapshot=self._snapshot
+            )
+        )
 
     @property
+    @_cached_per_generation
     def fan_modes(self):
         """Return the list of available fan modes."""
         fan_modes = []
@@ -334,7 +424,7 @@ class AguaIOTAirDevice(AguaIOTClimateDevice):
         """Return the current temperature."""
         if self._temperature_get_key:
             value = self._device.get_register_value_description(
-                self._temperature_get_key
+                self._temperature_get_key, snapshot=self._snapshot
             )
             if isinstance(value, numbers.Number):
                 return value
@@ -343,7 +433,9 @@ class AguaIOTAirDevice(AguaIOTClimateDevice):
     def target_temperature(self):
         """Return the temperature we try to reach."""
         if self.current_temperature:
-            return self._device.get_register_value(self._temperature_set_key)
+            return self._device.get_register_value(
+                self._temperature_set_key, snapshot=self._snapshot
+            )
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
@@ -398,9 +490,13 @@ class AguaIOTWaterDevice(AguaIOTClimateDevice):
         self._temperature_get_key = None
         for variant in WATER_VARIANTS:
             if (
-                f"temp_{variant}_get" in self._device.registers
-                and self._device.get_register_enabled(f"temp_{variant}_get")
-                and self._device.get_register_value(f"temp_{variant}_get")
+                f"temp_{variant}_get" in self._device.register_keys
+                and self._device.get_register_enabled(
+                    f"temp_{variant}_get", snapshot=self._snapshot
+                )
+                and self._device.get_register_value(
+                    f"temp_{variant}_get", snapshot=self._snapshot
+                )
             ):
                 self._temperature_get_key = f"temp_{variant}_get"
                 break
@@ -408,9 +504,13 @@ class AguaIOTWaterDevice(AguaIOTClimateDevice):
         self._temperature_set_key = None
         for variant in WATER_VARIANTS:
             if (
-                f"temp_{variant}_set" in self._device.registers
-                and self._device.get_register_enabled(f"temp_{variant}_set")
-                and self._device.get_register_value(f"temp_{variant}_set")
+                f"temp_{variant}_set" in self._device.register_keys
+                and self._device.get_register_enabled(
+                    f"temp_{variant}_set", snapshot=self._snapshot
+                )
+                and self._device.get_register_value(
+                    f"temp_{variant}_set", snapshot=self._snapshot
+                )
             ):
                 self._temperature_set_key = f"temp_{variant}_set"
                 break
@@ -489,7 +589,7 @@ class AguaIOTWaterDevice(AguaIOTClimateDevice):
         """Return the current temperature."""
         if self._temperature_get_key:
             value = self._device.get_register_value_description(
-                self._temperature_get_key
+                self._temperature_get_key, snapshot=self._snapshot
             )
             if isinstance(value, numbers.Number):
                 return value
@@ -498,7 +598,9 @@ class AguaIOTWaterDevice(AguaIOTClimateDevice):
     def target_temperature(self):
         """Return the temperature we try to reach."""
         if self.current_temperature:
-            return self._device.get_register_value(self._temperature_set_key)
+            return self._device.get_register_value(
+                self._temperature_set_key, snapshot=self._snapshot
+            )
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
@@ -535,7 +637,7 @@ class AguaIOTCanalizationDevice(AguaIOTClimateDevice):
 
         if (
             self.entity_description.key_vent_set
-            and self.entity_description.key_vent_set in self._device.registers
+            and self.entity_description.key_vent_set in self._device.register_keys
         ):
             self._fan_register = self.entity_description.key_vent_set
 
@@ -552,24 +654,32 @@ class AguaIOTCanalizationDevice(AguaIOTClimateDevice):
         features = ClimateEntityFeature.FAN_MODE
         if (
             self.entity_description.key_temp_set
-            and self.entity_description.key_temp_set in self._device.registers
-            and self._device.get_register_enabled(self.entity_description.key_temp_set)
+            and self.entity_description.key_temp_set in self._device.register_keys
+            and self._device.get_register_enabled(
+                self.entity_description.key_temp_set, snapshot=self._snapshot
+            )
         ):
             features |= ClimateEntityFeature.TARGET_TEMPERATURE
         if (
             self.entity_description.key_vent_set
-            and self.entity_description.key_vent_set in self._device.registers
+            and self.entity_description.key_vent_set in self._device.register_keys
         ):
             features |= ClimateEntityFeature.PRESET_MODE
 
         return features
 
     @property
+    @_cached_per_generation
     def fan_mode(self):
         """Return fan mode."""
-        return str(self._device.get_register_value_description(self._fan_register))
+        return str(
+            self._device.get_register_value_description(
+                self._fan_register, snapshot=self._snapshot
+            )
+        )
 
     @property
+    @_cached_per_generation
     def fan_modes(self):
         """Return the list of available fan modes."""
         fan_modes = []
@@ -606,7 +716,9 @@ class AguaIOTCanalizationDevice(AguaIOTClimateDevice):
 
     @property
     def preset_mode(self):
-        return self._device.get_register_value_description(self.entity_description.key)
+        return self._device.get_register_value_description(
+            self.entity_description.key, snapshot=self._snapshot
+        )
 
     async def async_set_preset_mode(self, preset_mode):
         """Set new target preset mode."""
@@ -619,20 +731,28 @@ class AguaIOTCanalizationDevice(AguaIOTClimateDevice):
             _LOGGER.error("Failed to set preset mode, error: %s", err)
 
     @property
+    @_cached_per_generation
     def hvac_action(self):
-        if self._device.get_register_value(self.entity_description.key):
+        if self._device.get_register_value(
+            self.entity_description.key, snapshot=self._snapshot
+        ):
             return self._parent.hvac_action
         return HVACAction.OFF
 
     @property
     def hvac_modes(self):
-        if self._device.get_register_value(self.entity_description.key):
+        if self._device.get_register_value(
+            self.entity_description.key, snapshot=self._snapshot
+        ):
             return [self._parent.hvac_mode]
         return [HVACMode.OFF]
 
     @property
+    @_cached_per_generation
     def hvac_mode(self):
-        if self._device.get_register_value(self.entity_description.key):
+        if self._device.get_register_value(
+            self.entity_description.key, snapshot=self._snapshot
+        ):
             return self._parent.hvac_mode
         return HVACMode.OFF
 
@@ -642,7 +762,7 @@ class AguaIOTCanalizationDevice(AguaIOTClimateDevice):
     @property
     def min_temp(self):
         """Return the minimum temperature to set."""
-        if self.entity_description.key_temp_set in self._device.registers:
+        if self.entity_description.key_temp_set in self._device.register_keys:
             return self._device.get_register_value_min(
                 self.entity_description.key_temp_set
             )
@@ -650,7 +770,7 @@ class AguaIOTCanalizationDevice(AguaIOTClimateDevice):
     @property
     def max_temp(self):
         """Return the maximum temperature to set."""
-        if self.entity_description.key_temp_set in self._device.registers:
+        if self.entity_description.key_temp_set in self._device.register_keys:
             return self._device.get_register_value_max(
                 self.entity_description.key_temp_set
             )
@@ -658,31 +778,35 @@ class AguaIOTCanalizationDevice(AguaIOTClimateDevice):
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        if self.entity_description.key_temp_set in self._device.registers:
+        if self.entity_description.key_temp_set in self._device.register_keys:
             if self.current_temperature:
                 return self._device.get_register_value(
-                    self.entity_description.key_temp_set
+                    self.entity_description.key_temp_set, snapshot=self._snapshot
                 )
 
     @property
     def current_temperature(self):
         """Return the current temperature."""
         if (
-            self.entity_description.key_temp_get in self._device.registers
-            and self._device.get_register_enabled(self.entity_description.key_temp_get)
+            self.entity_description.key_temp_get in self._device.register_keys
+            and self._device.get_register_enabled(
+                self.entity_description.key_temp_get, snapshot=self._snapshot
+            )
         ):
             value = self._device.get_register_value_description(
-                self.entity_description.key_temp_get
+                self.entity_description.key_temp_get, snapshot=self._snapshot
             )
             if isinstance(value, numbers.Number):
                 return value
         elif (
             self.entity_description.key_temp2_get
-            and self.entity_description.key_temp2_get in self._device.registers
-            and self._device.get_register_enabled(self.entity_description.key_temp2_get)
+            and self.entity_description.key_temp2_get in self._device.register_keys
+            and self._device.get_register_enabled(
+                self.entity_description.key_temp2_get, snapshot=self._snapshot
+            )
         ):
             value = self._device.get_register_value_description(
-                self.entity_description.key_temp2_get
+                self.entity_description.key_temp2_get, snapshot=self._snapshot
             )
             if isinstance(value, numbers.Number):
                 return value
@@ -704,7 +828,7 @@ class AguaIOTCanalizationDevice(AguaIOTClimateDevice):
     @property
     def target_temperature_step(self):
         """Return the supported step of target temperature."""
-        if self.entity_description.key_temp_set in self._device.registers:
+        if self.entity_description.key_temp_set in self._device.register_keys:
             return self._device.get_register(self.entity_description.key_temp_set).get(
                 "step", 1
             )
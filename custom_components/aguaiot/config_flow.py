@@ -1,5 +1,6 @@
 """Config flow for Agua IOT."""
 
+import contextlib
 import logging
 import uuid
 
@@ -9,7 +10,9 @@ from .aguaiot import (
     AguaIOTUnauthorized,
     aguaiot,
 )
-from .local_ble import LocalBleAguaIOT
+from .hybrid import HybridAguaIOT
+from .local_ble import BLE_IDLE_TIMEOUT, LocalBleAguaIOT
+from .storage import async_get_register_maps
 import voluptuous as vol
 
 from homeassistant.config_entries import (
@@ -26,6 +29,9 @@ from homeassistant.data_entry_flow import section
 from .const import (
     CONF_API_URL,
     CONF_BLE_BOOTSTRAP_DEVICES,
+    CONF_BLE_IDLE_TIMEOUT,
+    CONF_BLE_PERSISTENT_SESSION,
+    CONF_BLE_WRITE_PRIMING,
     CONF_CONNECTION_MODE,
     CONF_CUSTOMER_CODE,
     CONF_LOGIN_API_URL,
@@ -41,8 +47,12 @@ from .const import (
     CONF_BUFFER_READ_TIMEOUT,
     CONNECTION_MODE_BLUETOOTH,
     CONNECTION_MODE_CLOUD,
+    CONNECTION_MODE_HYBRID,
     DOMAIN,
     ENDPOINTS,
+    WRITE_PRIMING_ALWAYS,
+    WRITE_PRIMING_AUTO,
+    WRITE_PRIMING_NEVER,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -149,11 +159,14 @@ class AguaIOTConfigFlow(ConfigFlow, domain=DOMAIN):
 
 
 class AguaIOTOptionsFlowHandler(OptionsFlowWithReload):
+    _ble_results = ""
+    _pending_options = None
+
     async def async_step_init(self, _user_input=None):
         """Manage the options."""
         return await self.async_step_user()
 
-    def _build_client(self, connection_mode):
+    def _build_client(self, connection_mode, cached_devices=None):
         """Create the configured cloud or local BLE transport."""
         entry = self.config_entry
         return_kwargs = {
@@ -177,10 +190,17 @@ class AguaIOTOptionsFlowHandler(OptionsFlowWithReload):
             ),
         }
 
+        if connection_mode == CONNECTION_MODE_HYBRID:
+            return HybridAguaIOT(
+                hass=self.hass,
+                cached_devices=cached_devices,
+                **return_kwargs,
+            )
+
         if connection_mode == CONNECTION_MODE_BLUETOOTH:
             return LocalBleAguaIOT(
                 hass=self.hass,
-                cached_devices=entry.data.get(CONF_BLE_BOOTSTRAP_DEVICES),
+                cached_devices=cached_devices,
                 **return_kwargs,
             )
 
@@ -221,6 +241,38 @@ class AguaIOTOptionsFlowHandler(OptionsFlowWithReload):
                 {
                     CONNECTION_MODE_CLOUD,
                     CONNECTION_MODE_BLUETOOTH,
+                    CONNECTION_MODE_HYBRID,
+                }
+            ),
+            vol.Optional(
+                CONF_BLE_PERSISTENT_SESSION,
+                default=user_input.get(
+                    CONF_BLE_PERSISTENT_SESSION,
+                    self.config_entry.options.get(CONF_BLE_PERSISTENT_SESSION, False),
+                ),
+            ): bool,
+            vol.Optional(
+                CONF_BLE_IDLE_TIMEOUT,
+                default=user_input.get(
+                    CONF_BLE_IDLE_TIMEOUT,
+                    self.config_entry.options.get(
+                        CONF_BLE_IDLE_TIMEOUT, BLE_IDLE_TIMEOUT
+                    ),
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=30)),
+            vol.Optional(
+                CONF_BLE_WRITE_PRIMING,
+                default=user_input.get(
+                    CONF_BLE_WRITE_PRIMING,
+                    self.config_entry.options.get(
+                        CONF_BLE_WRITE_PRIMING, WRITE_PRIMING_AUTO
+                    ),
+                ),
+            ): vol.In(
+                {
+                    WRITE_PRIMING_AUTO,
+                    WRITE_PRIMING_ALWAYS,
+                    WRITE_PRIMING_NEVER,
                 }
             ),
             vol.Optional(
@@ -287,11 +339,25 @@ class AguaIOTOptionsFlowHandler(OptionsFlowWithReload):
                     CONF_CONNECTION_MODE, CONNECTION_MODE_CLOUD
                 ),
             )
+            agua = None
+            results = None
             try:
-                agua = self._build_client(connection_mode)
+                register_maps = await async_get_register_maps(self.hass)
+                agua = self._build_client(
+                    connection_mode,
+                    register_maps.attach(
+                        self.config_entry.data.get(CONF_API_URL),
+                        self.config_entry.data.get(CONF_BLE_BOOTSTRAP_DEVICES),
+                    ),
+                )
                 await agua.connect()
-                if connection_mode == CONNECTION_MODE_BLUETOOTH:
-                    await agua.validate_local_connection()
+                if connection_mode in (
+                    CONNECTION_MODE_BLUETOOTH,
+                    CONNECTION_MODE_HYBRID,
+                ):
+                    async with self._async_pause_running_ble():
+                        results = await agua.validate_local_connection()
+                    self._async_store_ble_bootstrap(agua, register_maps)
             except AguaIOTUnauthorized as e:
                 _LOGGER.error("Agua IOT Unauthorized: %s", e)
                 errors["base"] = "unauthorized"
@@ -302,10 +368,82 @@ class AguaIOTOptionsFlowHandler(OptionsFlowWithReload):
                 _LOGGER.error("Agua IOT error: %s", e)
                 errors["base"] = "unknown_error"
             else:
-                return self.async_create_entry(title="", data=user_input)
+                if not results:
+                    return self.async_create_entry(title="", data=user_input)
+
+                self._ble_results = _format_ble_results(results)
+                # With cloud fallback, a stove that fails validation still works.
+                if connection_mode == CONNECTION_MODE_HYBRID or all(
+                    result["ok"] for result in results
+                ):
+                    self._pending_options = user_input
+                    return await self.async_step_ble_validated()
+
+                errors["base"] = "ble_validation_failed"
+            finally:
+                if agua is not None:
+                    # Release the validation client's BLE subscriptions.
+                    await agua.close()
 
         return self.async_show_form(
             step_id="user",
             data_schema=self._build_schema(user_input),
             errors=errors,
+            description_placeholders={"ble_results": self._ble_results},
+        )
+
+    def _async_pause_running_ble(self):
+        """Return a context pausing the Bluetooth links of the loaded entry.
+
+        With a persistent session the modules are connected to the running
+        integration, and its connections hold the slots validation needs.
+        """
+        coordinator = getattr(self.config_entry, "runtime_data", None)
+        agua = getattr(coordinator, "agua", None)
+        if isinstance(agua, LocalBleAguaIOT):
+            return agua.async_paused()
+        return contextlib.nullcontext()
+
+    async def async_step_ble_validated(self, user_input=None):
+        """Show the Bluetooth validation result of each stove, then save."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=self._pending_options)
+
+        return self.async_show_form(
+            step_id="ble_validated",
+            data_schema=vol.Schema({}),
+            description_placeholders={"ble_results": self._ble_results},
+        )
+
+    @callback
+    def _async_store_ble_bootstrap(self, agua, register_maps):
+        """Persist the link details learned while validating, for the first poll."""
+        if not agua.cache_dirty:
+            return
+
+        register_maps.put_devices(agua.api_url, agua.devices)
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={
+                **self.config_entry.data,
+                CONF_BLE_BOOTSTRAP_DEVICES: agua.export_bootstrap_cache(),
+            },
         )
+
+
+def _format_ble_results(results):
+    """Return one line per stove describing its Bluetooth validation."""
+    lines = []
+    for result in results:
+        if result["ok"]:
+            lines.append(
+                f"- {result['device_name']}: OK in {result['elapsed']} s via "
+                f"{result['module_address']} ({result['module_name']}), "
+                f"buffers {', '.join(str(i) for i in result['buffer_ids'])}"
+            )
+        else:
+            lines.append(
+                f"- {result['device_name']}: failed after {result['elapsed']} s: "
+                f"{result['error']}"
+            )
+    return "\n".join(lines)
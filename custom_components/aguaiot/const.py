@@ -44,6 +44,14 @@ class AguaIOTSensorEntityDescription(SensorEntityDescription):
     hybrid_only: bool = False
     hybrid_exclude: bool = False
     raw_value: bool = False
+    # State write filtering. Changes of at least the deadband are written at
+    # once; smaller changes at most once per min_interval, or never without
+    # one. The deadband is absolute, or a number of register steps when only
+    # deadband_steps is set. Filtered values are rounded to the precision of
+    # the register step or format string.
+    deadband: float | None = None
+    deadband_steps: float = 0
+    min_interval: float = 0
 
 
 @dataclass
@@ -81,9 +89,25 @@ CONF_CONNECTION_MODE = "connection_mode"
 CONF_BLE_BOOTSTRAP_DEVICES = "ble_bootstrap_devices"
 CONF_BLE_SERVICE_UUID = "ble_service_uuid"
 CONF_BLE_CHAR_UUID = "ble_char_uuid"
+CONF_BLE_PERSISTENT_SESSION = "ble_persistent_session"
+CONF_BLE_IDLE_TIMEOUT = "ble_idle_timeout"
+CONF_BLE_WRITE_PRIMING = "ble_write_priming"
+
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 300
+
+# An update must finish this many seconds before the next one is due.
+UPDATE_DEADLINE_MARGIN = 1
+# Never give an update less time than this, however short the interval.
+UPDATE_DEADLINE_MIN = 10
 
 CONNECTION_MODE_CLOUD = "connection_cloud"
 CONNECTION_MODE_BLUETOOTH = "connection_bluetooth"
+CONNECTION_MODE_HYBRID = "connection_hybrid"
+
+WRITE_PRIMING_AUTO = "priming_auto"
+WRITE_PRIMING_ALWAYS = "priming_always"
+WRITE_PRIMING_NEVER = "priming_never"
 
 AIR_VARIANTS = ["air", "air2", "air3", "air_palm"]
 WATER_VARIANTS = ["water", "h2o", "h2o_mandata"]
@@ -376,6 +400,8 @@ SENSORS = (
         native_unit_of_measurement=UnitOfPressure.PA,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.PRESSURE,
+        deadband_steps=5,
+        min_interval=120,
     ),
     AguaIOTSensorEntityDescription(
         key="giri_estrattore_get",
@@ -384,6 +410,8 @@ SENSORS = (
         native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=None,
+        deadband=50,
+        min_interval=120,
     ),
     AguaIOTSensorEntityDescription(
         key="pomp_h2o_get",
@@ -400,6 +428,8 @@ SENSORS = (
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
+        deadband_steps=2,
+        min_interval=120,
     ),
     AguaIOTSensorEntityDescription(
         key="temp_probe_k_get",
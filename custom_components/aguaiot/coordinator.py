@@ -3,28 +3,44 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+import time
+from collections import Counter
+from datetime import datetime, timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD
 from homeassistant.helpers.httpx_client import get_async_client
 
 from .aguaiot import (
     AguaIOTConnectionError,
+    AguaIOTDeadlineExceeded,
     AguaIOTError,
     AguaIOTUnauthorized,
     AguaIOTUpdateError,
+    DeviceSnapshot,
+    UpdateDeadline,
     aguaiot,
 )
-from .local_ble import DEFAULT_CHAR_UUID, DEFAULT_SERVICE_UUID, LocalBleAguaIOT
+from .hybrid import HybridAguaIOT
+from .storage import RegisterMapStore, async_get_register_maps, device_cache_store
+from .local_ble import (
+    BLE_IDLE_TIMEOUT,
+    DEFAULT_CHAR_UUID,
+    DEFAULT_SERVICE_UUID,
+    LocalBleAguaIOT,
+)
 
 from .const import (
     CONF_API_URL,
     CONF_BLE_BOOTSTRAP_DEVICES,
     CONF_BLE_CHAR_UUID,
+    CONF_BLE_IDLE_TIMEOUT,
+    CONF_BLE_PERSISTENT_SESSION,
     CONF_BLE_SERVICE_UUID,
+    CONF_BLE_WRITE_PRIMING,
     CONF_CONNECTION_MODE,
     CONF_CUSTOMER_CODE,
     CONF_LOGIN_API_URL,
@@ -39,13 +55,18 @@ from .const import (
     CONF_BUFFER_READ_TIMEOUT,
     CONNECTION_MODE_BLUETOOTH,
     CONNECTION_MODE_CLOUD,
+    CONNECTION_MODE_HYBRID,
     DOMAIN,
+    STORAGE_SAVE_DELAY,
+    UPDATE_DEADLINE_MARGIN,
+    UPDATE_DEADLINE_MIN,
+    WRITE_PRIMING_AUTO,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class AguaIOTDataUpdateCoordinator(DataUpdateCoordinator):
+class AguaIOTDataUpdateCoordinator(DataUpdateCoordinator[dict[str, DeviceSnapshot]]):
     """Class to manage fetching data from the API."""
 
     def __init__(
@@ -62,6 +83,7 @@ class AguaIOTDataUpdateCoordinator(DataUpdateCoordinator):
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval),
             config_entry=config_entry,
+            always_update=False,
         )
 
         """Set up AguaIOT entry."""
@@ -99,26 +121,77 @@ class AguaIOTDataUpdateCoordinator(DataUpdateCoordinator):
             "buffer_read_timeout": buffer_read_timeout,
         }
 
-        if connection_mode == CONNECTION_MODE_BLUETOOTH:
-            self.agua = LocalBleAguaIOT(
+        if connection_mode in (CONNECTION_MODE_BLUETOOTH, CONNECTION_MODE_HYBRID):
+            transport = (
+                HybridAguaIOT
+                if connection_mode == CONNECTION_MODE_HYBRID
+                else LocalBleAguaIOT
+            )
+            self.agua = transport(
                 hass=hass,
-                cached_devices=config_entry.data.get(CONF_BLE_BOOTSTRAP_DEVICES),
                 service_uuid=config_entry.options.get(
                     CONF_BLE_SERVICE_UUID, DEFAULT_SERVICE_UUID
                 ),
                 char_uuid=config_entry.options.get(
                     CONF_BLE_CHAR_UUID, DEFAULT_CHAR_UUID
                 ),
+                persistent_session=config_entry.options.get(
+                    CONF_BLE_PERSISTENT_SESSION, False
+                ),
+                idle_timeout=config_entry.options.get(
+                    CONF_BLE_IDLE_TIMEOUT, BLE_IDLE_TIMEOUT
+                ),
+                write_priming=config_entry.options.get(
+                    CONF_BLE_WRITE_PRIMING, WRITE_PRIMING_AUTO
+                ),
                 **client_kwargs,
             )
         else:
             self.agua = aguaiot(**client_kwargs)
 
+        self._store = device_cache_store(hass, config_entry.entry_id)
+        self._connected = False
+        self.suppressed_writes = Counter()
+        self._connect_task = None
+        self._register_maps: RegisterMapStore | None = None
+        self._prefetch_unsub: CALLBACK_TYPE | None = None
+        # Seconds from an update starting until it has fresh register values.
+        self.update_latency = {"count": 0, "last": None, "avg": None, "max": None}
+        # Time budget of an update and where the last exceeded one ran out.
+        self.update_deadline = {
+            "budget": None,
+            "exceeded": 0,
+            "last_exceeded_stage": None,
+            "last_stages": {},
+        }
+
     async def _async_setup(self) -> None:
-        """Connect to the AguaIOT platform"""
+        """Restore devices from cache, or connect when nothing is cached yet.
+
+        With a usable cache the platforms are set up from the restored devices
+        and the cloud (or BLE) connection is completed in the background, so
+        Home Assistant startup never waits on the Agua IOT platform.
+        """
+        self._register_maps = await async_get_register_maps(self.hass)
+        if isinstance(self.agua, LocalBleAguaIOT):
+            self._async_migrate_ble_bootstrap()
+            self.agua.set_cached_devices(
+                self._register_maps.attach(
+                    self.agua.api_url,
+                    self.config_entry.data.get(CONF_BLE_BOOTSTRAP_DEVICES),
+                )
+            )
+
+        if await self._async_restore_cache():
+            self._connect_task = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_background_connect(),
+                f"{DOMAIN}_{self.config_entry.entry_id}_connect",
+            )
+            return
+
         try:
-            await self.agua.connect()
-            await self._async_persist_ble_bootstrap_if_needed()
+            await self._async_connect()
         except AguaIOTUpdateError as e:
             _LOGGER.error("Agua IOT Update error: %s", e)
         except AguaIOTUnauthorized as e:
@@ -128,11 +201,25 @@ class AguaIOTDataUpdateCoordinator(DataUpdateCoordinator):
         except AguaIOTError as e:
             raise UpdateFailed(f"Agua IOT error: {e}") from e
 
-    async def _async_update_data(self) -> None:
-        """Get the latest data."""
+    async def _async_update_data(self) -> dict[str, DeviceSnapshot]:
+        """Get the latest data.
+
+        Returns a snapshot per device. Snapshots only compare unequal when
+        register values changed, so unchanged polls do not notify entities.
+        """
+        if self._connect_task is not None and not self._connect_task.done():
+            # Keep serving restored values until the background connect is done.
+            return self._snapshots()
+
         try:
-            await self.agua.update()
+            if not self._connected:
+                await self._async_connect()
+            started = time.monotonic()
+            await self._async_update_within_deadline()
+            self._record_update_latency(time.monotonic() - started)
+            self._async_schedule_prefetch()
             await self._async_persist_ble_bootstrap_if_needed()
+            self._async_schedule_cache_save()
         except AguaIOTUpdateError as e:
             _LOGGER.error("Agua IOT Update error: %s", e)
         except AguaIOTUnauthorized as e:
@@ -142,6 +229,163 @@ class AguaIOTDataUpdateCoordinator(DataUpdateCoordinator):
         except AguaIOTError as e:
             raise UpdateFailed(f"Agua IOT error: {e}") from e
 
+        return self._snapshots()
+
+    async def _async_update_within_deadline(self) -> None:
+        """Update the devices, giving up before the next update is due.
+
+        Without a deadline a slow cloud job or Bluetooth connect could keep an
+        update running past the next one, which then starts on stale state.
+        """
+        budget = UPDATE_DEADLINE_MIN
+        if self.update_interval is not None:
+            budget = max(
+                self.update_interval.total_seconds() - UPDATE_DEADLINE_MARGIN,
+                UPDATE_DEADLINE_MIN,
+            )
+
+        deadline = UpdateDeadline(budget)
+        try:
+            async with deadline:
+                await self.agua.update()
+        except AguaIOTDeadlineExceeded:
+            self.update_deadline["exceeded"] += 1
+            self.update_deadline["last_exceeded_stage"] = deadline.expired_stage
+            raise
+        finally:
+            self.update_deadline["budget"] = budget
+            self.update_deadline["last_stages"] = {
+                stage: round(seconds, 3) for stage, seconds in deadline.stages.items()
+            }
+
+    def _record_update_latency(self, elapsed: float) -> None:
+        """Record how long an update took to get fresh register values."""
+        latency = self.update_latency
+        latency["count"] += 1
+        latency["last"] = round(elapsed, 3)
+        latency["avg"] = round(
+            elapsed
+            if latency["avg"] is None
+            else latency["avg"] + (elapsed - latency["avg"]) / latency["count"],
+            3,
+        )
+        latency["max"] = round(max(elapsed, latency["max"] or 0), 3)
+
+    @callback
+    def _async_schedule_prefetch(self) -> None:
+        """Submit the next cloud buffer read shortly before the next update."""
+        if not isinstance(self.agua, aguaiot) or self.update_interval is None:
+            return
+
+        if self._prefetch_unsub is not None:
+            self._prefetch_unsub()
+            self._prefetch_unsub = None
+
+        delay = self.update_interval.total_seconds() - self.agua.read_job_lead
+        if delay > 0:
+            self._prefetch_unsub = async_call_later(
+                self.hass, delay, self._async_prefetch
+            )
+
+    async def _async_prefetch(self, _now: datetime) -> None:
+        """Submit the buffer read jobs for the next update."""
+        self._prefetch_unsub = None
+        await self.agua.prefetch_device_information()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the scheduled buffer read prefetch."""
+        if self._prefetch_unsub is not None:
+            self._prefetch_unsub()
+            self._prefetch_unsub = None
+        await super().async_shutdown()
+
+    def _snapshots(self) -> dict[str, DeviceSnapshot]:
+        """Return the current snapshot of every device."""
+        return {device.id_device: device.snapshot for device in self.agua.devices}
+
+    async def _async_connect(self) -> None:
+        """Authenticate and fetch the device list and register maps."""
+        await self.agua.connect()
+        self._connected = True
+        self._register_maps.put_devices(self.agua.api_url, self.agua.devices)
+        await self._async_persist_ble_bootstrap_if_needed()
+        self._async_schedule_cache_save()
+
+    async def _async_background_connect(self) -> None:
+        """Finish startup in the background and reconcile changed registers."""
+        registers_before = self._registers_snapshot()
+        try:
+            await self._async_connect()
+        except AguaIOTError as e:
+            _LOGGER.warning(
+                "Agua IOT background connect failed, retrying on next update: %s", e
+            )
+            return
+
+        if self._registers_snapshot() != registers_before:
+            _LOGGER.info("Agua IOT devices or registers changed, reloading entry")
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+            return
+
+        await self.async_refresh()
+
+    def _registers_snapshot(self) -> dict:
+        """Return the register keys known per device."""
+        return {device.id_device: device.register_keys for device in self.agua.devices}
+
+    async def _async_restore_cache(self) -> bool:
+        """Restore devices and their last known values from the cache store."""
+        cache = await self._store.async_load()
+        devices = self._register_maps.attach(
+            self.agua.api_url, (cache or {}).get("devices")
+        )
+        if not devices:
+            return False
+
+        try:
+            self.agua.load_cached_devices(devices)
+            values = cache.get("values", {})
+            for device in self.agua.devices:
+                device.restore_information(values.get(str(device.id_device), {}))
+        except (KeyError, TypeError, ValueError) as e:
+            _LOGGER.warning("Ignoring invalid Agua IOT cache: %s", e)
+            self.agua.devices = []
+            return False
+
+        return bool(self.agua.devices)
+
+    def _async_schedule_cache_save(self) -> None:
+        """Schedule a delayed write of devices and values to the cache store."""
+        self._store.async_delay_save(self._cache_data, STORAGE_SAVE_DELAY)
+
+    def _cache_data(self) -> dict:
+        """Return the data persisted in the cache store."""
+        return {
+            "devices": [
+                device.export_cache(register_map=False) for device in self.agua.devices
+            ],
+            "values": {
+                str(device.id_device): device.export_information()
+                for device in self.agua.devices
+            },
+        }
+
+    def _async_migrate_ble_bootstrap(self) -> None:
+        """Move register maps persisted in the config entry into the map store."""
+        bootstrap = self.config_entry.data.get(CONF_BLE_BOOTSTRAP_DEVICES)
+        if not bootstrap or not any("register_map" in entry for entry in bootstrap):
+            return
+
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={
+                **self.config_entry.data,
+                CONF_BLE_BOOTSTRAP_DEVICES: self._register_maps.strip(
+                    self.agua.api_url, bootstrap
+                ),
+            },
+        )
+
     async def _async_persist_ble_bootstrap_if_needed(self) -> None:
         """Persist BLE bootstrap data when it is freshly learned from the cloud."""
         if not isinstance(self.agua, LocalBleAguaIOT) or not self.agua.cache_dirty:
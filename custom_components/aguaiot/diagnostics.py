@@ -27,7 +27,21 @@ async def async_get_config_entry_diagnostics(
         for reg in device.registers:
             devices[device.name][reg] = device.get_register(reg)
 
-    return {
+    diagnostics = {
         "entry": async_redact_data(config_entry.as_dict(), TO_REDACT),
         "devices": devices,
+        "suppressed_writes": dict(coordinator.suppressed_writes),
+        "update_latency": dict(coordinator.update_latency),
+        "update_deadline": dict(coordinator.update_deadline),
+        "queue_stats": {device.name: device.queue_stats for device in agua.devices},
     }
+    if hasattr(agua, "read_job_stats"):
+        diagnostics["read_job_stats"] = agua.read_job_stats
+    if hasattr(agua, "online_stats"):
+        diagnostics["online_stats"] = agua.online_stats
+    if hasattr(agua, "link_stats"):
+        diagnostics["ble_link_stats"] = agua.link_stats
+    if hasattr(agua, "slot_stats"):
+        diagnostics["ble_slot_stats"] = agua.slot_stats
+
+    return diagnostics
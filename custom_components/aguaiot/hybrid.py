@@ -0,0 +1,198 @@
+"""Bluetooth transport falling back to the Micronova cloud API."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from bleak import BleakError
+
+from .aguaiot import AguaIOTError, Device, aguaiot, deadline_stage
+from .local_ble import LocalBleAguaIOT
+
+_LOGGER = logging.getLogger(__name__)
+
+PATH_BLE = "ble"
+PATH_CLOUD = "cloud"
+
+# Smoothing factor of the per-path success rate and latency averages.
+HYBRID_EWMA_ALPHA = 0.3
+# Assumed latency of a path that has not been used yet.
+HYBRID_DEFAULT_LATENCY = {PATH_BLE: 2.0, PATH_CLOUD: 10.0}
+# Retry Bluetooth at least this often while the cloud is preferred.
+HYBRID_BLE_PROBE_INTERVAL = 300
+
+
+class HybridAguaIOT(LocalBleAguaIOT):
+    """Read and write over Bluetooth, using cloud jobs when that is faster or BLE fails.
+
+    Both paths update the same `Device` objects, so entities do not notice
+    which one served an operation.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._cloud: aguaiot | None = None
+        self._path_stats: dict[tuple[str, str, str], dict[str, Any]] = {}
+
+    async def _async_cloud(self) -> aguaiot:
+        """Return a logged in cloud client, logging in on first use."""
+        if self._cloud is None:
+            cloud = self._cloud_client()
+            with deadline_stage("cloud login"):
+                await cloud.register_app_id()
+                await cloud.login()
+            self._cloud = cloud
+
+        return self._cloud
+
+    async def _fetch_device_information(self, device: Device) -> dict[int, int]:
+        """Read the stove buffers over the best path."""
+        ble_read = super()._fetch_device_information
+
+        async def cloud_read() -> dict[int, int]:
+            cloud = await self._async_cloud()
+            # The cloud job reads the first buffer only; keep the values of the
+            # other buffers from the last Bluetooth read.
+            return {
+                **device.snapshot.information,
+                **await cloud._fetch_device_information(device),
+            }
+
+        return await self._async_run_hybrid(
+            device, "read", lambda: ble_read(device), cloud_read
+        )
+
+    async def _request_writing(self, device: Device, items: dict[str, int]) -> None:
+        """Write raw register values over the best path.
+
+        Writes set absolute values, so repeating one on the other path after a
+        failure is safe.
+        """
+        ble_write = super()._request_writing
+
+        async def cloud_write() -> None:
+            cloud = await self._async_cloud()
+            await cloud._request_writing(device, items)
+
+        await self._async_run_hybrid(
+            device, "write", lambda: ble_write(device, items), cloud_write
+        )
+
+    async def _async_run_hybrid(
+        self,
+        device: Device,
+        operation: str,
+        ble_call: Callable[[], Awaitable[Any]],
+        cloud_call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run an operation on the preferred path, falling back to the other one."""
+        calls = {PATH_BLE: ble_call, PATH_CLOUD: cloud_call}
+        paths = self._path_order(device, operation)
+
+        for path in paths:
+            start = time.monotonic()
+            try:
+                result = await calls[path]()
+            except (AguaIOTError, BleakError, asyncio.TimeoutError) as err:
+                self._record_path(device, operation, path, False)
+                if path == paths[-1]:
+                    raise
+                _LOGGER.debug(
+                    "%s over %s failed for '%s', falling back: %s",
+                    operation,
+                    path,
+                    device.name,
+                    err,
+                )
+                continue
+
+            self._record_path(device, operation, path, True, time.monotonic() - start)
+            return result
+
+    def _path_order(self, device: Device, operation: str) -> list[str]:
+        """Return the paths to try for an operation, best first."""
+        if self._ble_busy(device):
+            return [PATH_CLOUD, PATH_BLE]
+
+        ble = self._path(device, operation, PATH_BLE)
+        if ble["last_attempt"] + HYBRID_BLE_PROBE_INTERVAL < time.monotonic():
+            # Re-measure Bluetooth now and then, it may have recovered.
+            return [PATH_BLE, PATH_CLOUD]
+
+        if self._expected_time(device, operation, PATH_BLE) <= self._expected_time(
+            device, operation, PATH_CLOUD
+        ):
+            return [PATH_BLE, PATH_CLOUD]
+
+        return [PATH_CLOUD, PATH_BLE]
+
+    def _ble_busy(self, device: Device) -> bool:
+        """Return True when no Bluetooth connection slot can be used right now."""
+        if device.id_device in self._sessions:
+            return False
+
+        source = self._slot_source(device)
+        if self._slot_free(source):
+            return False
+
+        return self._lru_idle_session(source) is None
+
+    def _expected_time(self, device: Device, operation: str, path: str) -> float:
+        """Return the expected time to complete an operation, retries included."""
+        stats = self._path(device, operation, path)
+        latency = stats["latency"] or HYBRID_DEFAULT_LATENCY[path]
+        return latency / max(stats["success"], 0.05)
+
+    def _path(self, device: Device, operation: str, path: str) -> dict[str, Any]:
+        """Return the statistics of one path for one operation."""
+        return self._path_stats.setdefault(
+            (device.id_device, operation, path),
+            {
+                "ok": 0,
+                "failed": 0,
+                "success": 1.0,
+                "latency": None,
+                "last_attempt": 0.0,
+            },
+        )
+
+    def _record_path(
+        self,
+        device: Device,
+        operation: str,
+        path: str,
+        ok: bool,
+        elapsed: float | None = None,
+    ) -> None:
+        """Update the success rate and latency of a path."""
+        stats = self._path(device, operation, path)
+        stats["ok" if ok else "failed"] += 1
+        stats["success"] += HYBRID_EWMA_ALPHA * (float(ok) - stats["success"])
+        stats["last_attempt"] = time.monotonic()
+        if elapsed is not None:
+            stats["latency"] = (
+                elapsed
+                if stats["latency"] is None
+                else stats["latency"] + HYBRID_EWMA_ALPHA * (elapsed - stats["latency"])
+            )
+
+    @property
+    def link_stats(self) -> dict[str, Any]:
+        """Return the Bluetooth link statistics and the per-path choices."""
+        link_stats = super().link_stats
+        for (device_id, operation, path), stats in self._path_stats.items():
+            link_stats.setdefault(device_id, {}).setdefault("paths", {}).setdefault(
+                operation, {}
+            )[path] = {
+                "ok": stats["ok"],
+                "failed": stats["failed"],
+                "success_rate": round(stats["success"], 2),
+                "avg_latency": round(stats["latency"], 3)
+                if stats["latency"] is not None
+                else None,
+            }
+        return link_stats
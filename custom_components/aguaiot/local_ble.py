@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
+import random
 import re
 import struct
+import time
 import uuid
 from typing import Any
 
 from bleak import BleakClient, BleakError
 from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 
 from .aguaiot import (
     AguaIOTConnectionError,
@@ -21,15 +24,39 @@ from .aguaiot import (
     AguaIOTUpdateError,
     Device,
     aguaiot,
+    deadline_stage,
+    deadline_timeout,
 )
+from .const import WRITE_PRIMING_ALWAYS, WRITE_PRIMING_AUTO, WRITE_PRIMING_NEVER
 
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SERVICE_UUID = "6e400001-b5a3-f393-e0a9-e50e24dcca9e"
 DEFAULT_CHAR_UUID = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"
 DEFAULT_NAME_PREFIX = "T009_"
-BLE_DISCOVERY_RETRY_INTERVAL = 1
 BLE_DISCOVERY_MAX_WAIT = 30
+BLE_KEEPALIVE_INTERVAL = 20
+BLE_IDLE_TIMEOUT = 300
+BLE_WRITE_WINDOW = 8
+BLE_PRIMING_MAX_AGE = 30
+BLE_FULL_READ_INTERVAL = 900
+# Connection slot users; waiting writes are served before waiting polls.
+SLOT_PRIORITY_WRITE = "write"
+SLOT_PRIORITY_POLL = "poll"
+# Cost of a scanner path to a stove, in dB: the signal strength, plus a cost
+# per second of measured connect time and command round trip, plus a cost for
+# recent failed connects and lost authorizations.
+BLE_PATH_DEFAULT_RSSI = -90
+BLE_PATH_SECONDS_COST = 10
+BLE_PATH_FAILURE_COST = 30
+BLE_PATH_EWMA_ALPHA = 0.3
+# Wait before reconnecting after a lost authorization, doubling per
+# consecutive loss of the same stove, with jitter.
+BLE_AUTH_BACKOFF_BASE = 0.5
+BLE_AUTH_BACKOFF_MAX = 10
+# "JSON" magic, little-endian body length and the protocol marker 0xF9 0x01.
+JSON_HEADER = struct.Struct("<4sH2s")
+JSON_HEADER_SIZE = JSON_HEADER.size
 
 
 def _is_ble_authorization_error(err: Exception) -> bool:
@@ -79,6 +106,11 @@ def _increment_ble_address(value: str, delta: int) -> str:
 class LocalBleAguaIOT:
     """Micronova transport using the local BLE API exposed by the T009 module."""
 
+    # Cancelling a GATT exchange midway could leave a late response on the link.
+    preemptible_reads = False
+    # The cloud online state says nothing about the Bluetooth link.
+    reports_online = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -101,6 +133,9 @@ class LocalBleAguaIOT:
         service_uuid: str = DEFAULT_SERVICE_UUID,
         char_uuid: str = DEFAULT_CHAR_UUID,
         cached_devices: list[dict[str, Any]] | None = None,
+        persistent_session: bool = False,
+        idle_timeout: int | None = BLE_IDLE_TIMEOUT,
+        write_priming: str = WRITE_PRIMING_AUTO,
     ) -> None:
         self.hass = hass
         self.api_url = api_url.rstrip("/")
@@ -125,7 +160,37 @@ class LocalBleAguaIOT:
         self._session_uuid = str(uuid.uuid4()).upper()
         self._cached_devices = cached_devices or []
         self._cache_dirty = False
-        self._command_lock = asyncio.Lock()
+        self._device_locks: dict[str, asyncio.Lock] = {}
+        # Connection slots in use, waiting requests and statistics per proxy
+        # source; None when the source of the stove is not known.
+        self._slots_in_use: dict[str | None, int] = {}
+        self._slot_waiters: dict[str | None, dict[str, int]] = {}
+        self._slot_stats: dict[str | None, dict[str, Any]] = {}
+        self._slots_changed = asyncio.Condition()
+        # Scanner source of the path chosen for, and last connected to, a stove.
+        self._selected_sources: dict[str, str] = {}
+        self._connected_sources: dict[str, str | None] = {}
+        # Consecutive authorization losses per stove, for the reconnect backoff.
+        self._auth_losses: dict[str, int] = {}
+        self.persistent_session = persistent_session
+        self.idle_timeout = idle_timeout or BLE_IDLE_TIMEOUT
+        self.write_priming = write_priming
+        self._sessions: dict[str, _BleMicronovaSession] = {}
+        self._keepalive_tasks: dict[str, asyncio.Task] = {}
+        self._link_stats: dict[str, dict[str, Any]] = {}
+        # Learned per stove: BLE address, tunnel characteristic and buffer ids.
+        self._link_cache: dict[str, dict[str, Any]] = {}
+        # Offsets returned by each buffer, and when all buffers were last read.
+        self._buffer_layout: dict[str, dict[int, frozenset[int]]] = {}
+        self._last_full_read: dict[str, float] = {}
+        # Encoded messages of commands whose payload does not change.
+        self._fixed_commands: dict[tuple, bytes] = {}
+        # Latest advertisement per stove, fed by Home Assistant's bluetooth callbacks.
+        self._advertisements: dict[str, Any] = {}
+        self._advertisement_events: dict[str, asyncio.Event] = {}
+        self._advertisement_unsubs: dict[str, list[CALLBACK_TYPE]] = {}
+        self._advertisement_targets: dict[str, str] = {}
+        self._prefix_advertisement: Any = None
 
     @property
     def cache_dirty(self) -> bool:
@@ -133,8 +198,21 @@ class LocalBleAguaIOT:
         return self._cache_dirty
 
     def export_bootstrap_cache(self) -> list[dict[str, Any]]:
-        """Export device bootstrap data for config entry persistence."""
-        return [device.export_cache() for device in self.devices]
+        """Export device bootstrap data for config entry persistence.
+
+        Register maps are left out; they are stored once per model.
+        """
+        return [
+            {
+                **device.export_cache(register_map=False),
+                "ble_link": dict(self._link(device)),
+            }
+            for device in self.devices
+        ]
+
+    def set_cached_devices(self, cached_devices: list[dict[str, Any]] | None) -> None:
+        """Set the bootstrap data used instead of the cloud API on connect."""
+        self._cached_devices = cached_devices or []
 
     def mark_cache_persisted(self) -> None:
         """Clear the dirty flag once bootstrap data is stored."""
@@ -142,8 +220,12 @@ class LocalBleAguaIOT:
 
     async def connect(self) -> None:
         """Initialize devices from cache, or bootstrap once through the cloud API."""
+        if self.devices:
+            # Already restored from the integration cache.
+            return
+
         if self._cached_devices:
-            self._load_cached_devices(self._cached_devices)
+            self.load_cached_devices(self._cached_devices)
             return
 
         await self._bootstrap_from_cloud()
@@ -154,23 +236,55 @@ class LocalBleAguaIOT:
             await dev.update_mapping()
 
     async def update(self) -> None:
-        """Refresh all devices using BLE."""
-        for dev in self.devices:
-            await dev.update()
+        """Refresh all devices using BLE, concurrently within the free slots."""
+        results = await asyncio.gather(
+            *(dev.update() for dev in self.devices), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def validate_local_connection(self) -> list[dict[str, Any]]:
+        """Detect and validate the local BLE module of every configured stove.
 
-    async def validate_local_connection(self) -> dict[str, Any]:
-        """Detect and validate the local BLE module for the first configured stove."""
+        Stoves are validated concurrently, limited by the shared connection
+        slots. Each result holds the time taken and either the module address
+        and buffer ids, or the error. Learned link details are kept, so they
+        can be persisted for the first poll.
+        """
         if not self.devices:
             raise AguaIOTError(
                 "No Micronova devices are available for local Bluetooth."
             )
 
-        device = self.devices[0]
-        result = await self._run_authenticated_session(
-            device,
-            "validating the local Bluetooth connection",
-            self._validate_local_connection_session,
+        return list(
+            await asyncio.gather(
+                *(self._validate_device(device) for device in self.devices)
+            )
         )
+
+    async def _validate_device(self, device: Device) -> dict[str, Any]:
+        """Validate the local BLE module of one stove."""
+        started = time.monotonic()
+        try:
+            result = await self._run_authenticated_session(
+                device,
+                "validating the local Bluetooth connection",
+                self._validate_local_connection_session,
+            )
+        except (AguaIOTError, BleakError) as err:
+            _LOGGER.warning(
+                "Could not validate Micronova BLE module for '%s': %s",
+                device.name,
+                err,
+            )
+            return {
+                "device_name": device.name,
+                "ok": False,
+                "error": str(err),
+                "elapsed": round(time.monotonic() - started, 2),
+            }
+
         _LOGGER.info(
             "Validated Micronova BLE module for '%s' via %s (%s), buffer_ids=%s",
             device.name,
@@ -178,11 +292,11 @@ class LocalBleAguaIOT:
             result["module_name"],
             result["buffer_ids"],
         )
-        return result
+        return {**result, "ok": True, "elapsed": round(time.monotonic() - started, 2)}
 
-    async def _bootstrap_from_cloud(self) -> None:
-        """Fetch device metadata and register mappings once via the cloud API."""
-        cloud = aguaiot(
+    def _cloud_client(self) -> aguaiot:
+        """Create a cloud API client with the same account settings."""
+        return aguaiot(
             api_url=self.api_url,
             customer_code=self.customer_code,
             email=self.email,
@@ -199,6 +313,10 @@ class LocalBleAguaIOT:
             http_timeout=self.http_timeout,
             buffer_read_timeout=self.buffer_read_timeout,
         )
+
+    async def _bootstrap_from_cloud(self) -> None:
+        """Fetch device metadata and register mappings once via the cloud API."""
+        cloud = self._cloud_client()
         await cloud.connect()
 
         self.devices = [
@@ -219,24 +337,18 @@ class LocalBleAguaIOT:
         ]
         self._cache_dirty = True
 
-    def _load_cached_devices(self, cached_devices: list[dict[str, Any]]) -> None:
+    def load_cached_devices(self, cached_devices: list[dict[str, Any]]) -> None:
         """Restore devices from persisted bootstrap cache."""
-        self.devices = [
-            Device(
-                entry["id"],
-                entry["id_device"],
-                entry["id_product"],
-                entry["product_serial"],
-                entry["name"],
-                entry["is_online"],
-                entry["name_product"],
-                entry["id_registers_map"],
-                self,
-                device_info=entry.get("device_info"),
-                register_map=entry.get("register_map"),
+        bootstrap_links = {
+            entry["id_device"]: entry.get("ble_link") for entry in self._cached_devices
+        }
+        self.devices = [Device.from_cache(entry, self) for entry in cached_devices]
+        self._link_cache = {
+            entry["id_device"]: dict(
+                entry.get("ble_link") or bootstrap_links.get(entry["id_device"]) or {}
             )
             for entry in cached_devices
-        ]
+        }
 
     async def _fetch_device_registers_mapping(self, device: Device) -> dict[str, Any]:
         """Return the cached registers map."""
@@ -285,6 +397,7 @@ class LocalBleAguaIOT:
             device,
             "writing stove registers",
             lambda session: self._request_writing_session(session, payload),
+            SLOT_PRIORITY_WRITE,
         )
 
     async def _validate_local_connection_session(
@@ -292,7 +405,9 @@ class LocalBleAguaIOT:
     ) -> dict[str, Any]:
         """Validate the BLE tunnel through an authenticated session."""
         buffer_ids = await session.get_buffer_ids()
-        if not buffer_ids:
+        if buffer_ids:
+            self._remember_link(session._device, "buffer_ids", buffer_ids)
+        else:
             raise AguaIOTUpdateError(
                 f"Bluetooth validation succeeded but no buffer IDs were returned for '{session._device.name}'."
             )
@@ -310,78 +425,659 @@ class LocalBleAguaIOT:
     async def _fetch_device_information_session(
         self, session: "_BleMicronovaSession"
     ) -> dict[int, int]:
-        """Read all current buffer values through an authenticated session."""
-        buffer_ids = await session.get_buffer_ids()
+        """Read the current buffer values through an authenticated session.
+
+        Only the buffers holding registers that entities use are read, except
+        for a full read every BLE_FULL_READ_INTERVAL seconds. Registers of
+        skipped buffers keep their last value.
+        """
+        device = session._device
+        buffer_ids = await self._async_buffer_ids(session)
         if not buffer_ids:
             buffer_ids = [1]
+        planned = self._plan_buffer_reads(device, buffer_ids)
+        layout = self._buffer_layout.setdefault(device.id_device, {})
 
         info: dict[int, int] = {}
-        for buffer_id in buffer_ids:
-            response = await session.get_buffer_reading(buffer_id)
-            payload = response.get("pl", {})
-            items = payload.get("Items") or []
-            values = payload.get("Values") or []
-            if not isinstance(items, list) or not isinstance(values, list):
-                continue
+        try:
+            for buffer_id in planned:
+                response = await session.get_buffer_reading(buffer_id)
+                payload = response.get("pl", {})
+                items = payload.get("Items") or []
+                values = payload.get("Values") or []
+                if not isinstance(items, list) or not isinstance(values, list):
+                    continue
 
-            for idx, item in enumerate(items):
-                if idx < len(values):
-                    info[item] = values[idx]
+                layout[buffer_id] = frozenset(items)
+                for idx, item in enumerate(items):
+                    if idx < len(values):
+                        info[item] = values[idx]
 
-        if not info:
-            raise AguaIOTUpdateError(
-                f"Bluetooth read returned no register values for '{session._device.name}'."
-            )
+            if not info:
+                raise AguaIOTUpdateError(
+                    f"Bluetooth read returned no register values for '{device.name}'."
+                )
+        except AguaIOTError:
+            # The learned buffer ids may be stale; ask the module next time.
+            self._forget_link(device, "buffer_ids")
+            raise
 
-        return info
+        reads = self._stats(device)["reads"]
+        if len(planned) == len(buffer_ids):
+            reads["full"] += 1
+            self._last_full_read[device.id_device] = time.monotonic()
+            # Offsets no entity read since the last full read, for example of
+            # disabled entities, drop out of the partial reads.
+            device.reset_used_registers()
+            return info
+
+        reads["partial"] += 1
+        reads["buffers_skipped"] += len(buffer_ids) - len(planned)
+        return {**device.snapshot.information, **info}
+
+    def _plan_buffer_reads(self, device: Device, buffer_ids: list[int]) -> list[int]:
+        """Return the buffers to read, limited to those holding used registers."""
+        layout = self._buffer_layout.get(device.id_device, {})
+        used = device.used_offsets
+        if (
+            not used
+            or any(buffer_id not in layout for buffer_id in buffer_ids)
+            or time.monotonic() - self._last_full_read.get(device.id_device, 0)
+            >= BLE_FULL_READ_INTERVAL
+        ):
+            return buffer_ids
+
+        return [
+            buffer_id for buffer_id in buffer_ids if layout[buffer_id] & used
+        ] or buffer_ids[:1]
 
     async def _request_writing_session(
         self, session: "_BleMicronovaSession", payload: dict[str, Any]
     ) -> None:
         """Write raw register values through an authenticated session."""
-        buffer_ids = await session.get_buffer_ids()
-        if buffer_ids:
-            # Prime the local session the same way the vendor app does:
-            # it reads buffers before sending writes.
-            await session.get_buffer_reading(buffer_ids[0])
-        response = await session.exchange(self._make_enveloped_command(payload))
+        primed = self._write_needs_priming(session)
+        if primed:
+            buffer_ids = await self._async_buffer_ids(session)
+            if buffer_ids:
+                # Prime the local session the same way the vendor app does:
+                # it reads buffers before sending writes.
+                await session.get_buffer_reading(buffer_ids[0])
+            else:
+                primed = False
+        response = await session.exchange(
+            self._encode_command(payload), "RequestWriting"
+        )
         response_payload = response.get("pl", {})
+        self._record_write(session._device, primed, response_payload)
         if response_payload.get("NackErrCode") is not None:
             raise AguaIOTError(
                 f"Bluetooth write failed for '{session._device.name}' with NackErrCode={response_payload['NackErrCode']}"
             )
 
+    def _write_needs_priming(self, session: "_BleMicronovaSession") -> bool:
+        """Return True when a buffer read should precede a write."""
+        if self.write_priming == WRITE_PRIMING_ALWAYS:
+            return True
+        if self.write_priming == WRITE_PRIMING_NEVER:
+            return False
+
+        # The module only needs one read on a fresh link; a persistent session
+        # that was polled recently has already been primed by that read.
+        return (
+            session.last_read is None
+            or time.monotonic() - session.last_read > BLE_PRIMING_MAX_AGE
+        )
+
+    async def _async_buffer_ids(self, session: "_BleMicronovaSession") -> list[int]:
+        """Return the buffer ids of the stove, asking the module only once."""
+        buffer_ids = self._link(session._device).get("buffer_ids")
+        if buffer_ids:
+            return buffer_ids
+
+        buffer_ids = await session.get_buffer_ids()
+        if buffer_ids:
+            self._remember_link(session._device, "buffer_ids", buffer_ids)
+        return buffer_ids
+
+    def _link(self, device: Device) -> dict[str, Any]:
+        """Return the learned link details of a stove."""
+        return self._link_cache.setdefault(device.id_device, {})
+
+    def _remember_link(self, device: Device, key: str, value: Any) -> None:
+        """Store a learned link detail, marking the bootstrap cache dirty on change."""
+        link = self._link(device)
+        if link.get(key) != value:
+            link[key] = value
+            self._cache_dirty = True
+
+    def _forget_link(self, device: Device, *keys: str) -> None:
+        """Drop learned link details that proved wrong, so they are re-learned."""
+        link = self._link(device)
+        for key in keys:
+            if link.pop(key, None) is not None:
+                self._cache_dirty = True
+
     async def _run_authenticated_session(
         self,
         device: Device,
         action: str,
         operation,
+        priority: str = SLOT_PRIORITY_POLL,
     ) -> Any:
-        """Run one BLE action with a single retry on lost authorization."""
+        """Run one BLE action with a single retry on lost authorization.
+
+        The retry uses a fresh connection after a backoff that grows with the
+        consecutive authorization losses of the stove.
+        """
         for attempt in range(2):
             try:
-                async with self._device_session(device) as session:
-                    await session.identity()
-                    return await operation(session)
-            except (BleakError, AguaIOTConnectionError) as err:
+                if self.persistent_session:
+                    result = await self._run_persistent_session(
+                        device, operation, priority
+                    )
+                else:
+                    async with self._device_session(device, priority) as session:
+                        result = await self._run_identified(session, operation)
+            except (BleakError, AguaIOTConnectionError, AguaIOTUpdateError) as err:
                 if not _is_ble_authorization_error(err):
                     raise
 
+                auth = self._stats(device)["auth"]
+                auth["lost"] += 1
+                losses = self._auth_losses.get(device.id_device, 0) + 1
+                self._auth_losses[device.id_device] = losses
+                self._record_path_failure(
+                    device, self._connected_sources.get(device.id_device), "auth_losses"
+                )
+                if self.persistent_session:
+                    async with self._device_lock(device):
+                        await self._async_drop_session(device)
+
                 if attempt == 0:
+                    delay = min(
+                        BLE_AUTH_BACKOFF_MAX, BLE_AUTH_BACKOFF_BASE * 2 ** (losses - 1)
+                    )
+                    delay = random.uniform(delay / 2, delay)
                     _LOGGER.warning(
-                        "Micronova BLE link for '%s' lost authorization while %s; retrying once with a fresh connection.",
+                        "Micronova BLE link for '%s' lost authorization while %s; retrying once with a fresh connection in %.1f seconds.",
                         device.name,
                         action,
+                        delay,
                     )
-                    await asyncio.sleep(0.5)
+                    with deadline_stage("ble auth backoff"):
+                        await asyncio.sleep(delay)
                     continue
 
+                auth["failed"] += 1
                 raise AguaIOTConnectionError(
                     f"Bluetooth connection to '{device.name}' lost authorization while {action}. "
                     "The Navel/T009 module or Bluetooth proxy dropped its authorized GATT state; "
                     "reloading the integration or resetting the BLE module may be required."
                 ) from err
 
+            if attempt:
+                self._stats(device)["auth"]["reconnected"] += 1
+            self._auth_losses.pop(device.id_device, None)
+            return result
+
+    async def _run_identified(self, session: "_BleMicronovaSession", operation) -> Any:
+        """Run one BLE action, sending Identity only when the session needs it.
+
+        A NACK marks the session unauthenticated; the action is then retried
+        once on the same link after a new Identity.
+        """
+        if not session.authenticated:
+            await session.identity()
+
+        try:
+            return await operation(session)
+        except AguaIOTError:
+            if session.authenticated or not session.is_connected:
+                raise
+
+        _LOGGER.debug(
+            "Micronova BLE module NACKed a command for '%s'; sending Identity again",
+            session._device.name,
+        )
+        await session.identity()
+        result = await operation(session)
+        self._stats(session._device)["auth"]["reidentified"] += 1
+        return result
+
+    async def _run_persistent_session(
+        self, device: Device, operation, priority: str = SLOT_PRIORITY_POLL
+    ) -> Any:
+        """Run one BLE action on the kept-open link, reconnecting when it dropped."""
+        try:
+            async with self._device_lock(device):
+                session = self._sessions.get(device.id_device)
+                try:
+                    if session is None or not session.is_connected:
+                        await self._async_drop_session(device)
+                        session = self._device_session(device, priority)
+                        await session.connect()
+                        self._sessions[device.id_device] = session
+                        self._start_keepalive(device)
+                    session.last_used = time.monotonic()
+                    return await self._run_identified(session, operation)
+                except (BleakError, AguaIOTConnectionError):
+                    await self._async_drop_session(device)
+                    raise
+        finally:
+            await self._async_session_idle()
+
+    def _start_keepalive(self, device: Device) -> None:
+        """Start the keep-alive loop for a persistent session."""
+        task = self._keepalive_tasks.get(device.id_device)
+        if task is None or task.done():
+            self._keepalive_tasks[device.id_device] = (
+                self.hass.async_create_background_task(
+                    self._async_keepalive(device),
+                    f"aguaiot_ble_keepalive_{device.id_device}",
+                )
+            )
+
+    async def _async_keepalive(self, device: Device) -> None:
+        """Keep the persistent link alive until it drops or stays idle too long."""
+        while True:
+            await asyncio.sleep(BLE_KEEPALIVE_INTERVAL)
+            session = self._sessions.get(device.id_device)
+            if session is None or not session.is_connected:
+                return
+
+            if time.monotonic() - session.last_used >= self.idle_timeout:
+                _LOGGER.debug(
+                    "Closing idle Micronova BLE session for '%s'", device.name
+                )
+                async with self._device_lock(device):
+                    await self._async_drop_session(device)
+                return
+
+            if self._device_lock(device).locked():
+                continue
+
+            async with self._device_lock(device):
+                try:
+                    await session.get_buffer_ids()
+                except (BleakError, AguaIOTError) as err:
+                    _LOGGER.debug(
+                        "Micronova BLE keep-alive for '%s' failed: %s", device.name, err
+                    )
+                    await self._async_drop_session(device)
+                    return
+            await self._async_session_idle()
+
+    async def _async_session_idle(self) -> None:
+        """Wake slot waiters; the idle session may now be evicted for another stove."""
+        async with self._slots_changed:
+            self._slots_changed.notify_all()
+
+    def _device_lock(self, device: Device) -> asyncio.Lock:
+        """Return the lock serializing BLE commands for one stove."""
+        return self._device_locks.setdefault(device.id_device, asyncio.Lock())
+
+    def _connection_slot_limit(self, source: str | None = None) -> int:
+        """Return how many BLE connections may be open at once through a proxy.
+
+        Without a known source, one connection per connectable scanner is used.
+        """
+        if source is not None and (
+            allocations := bluetooth.async_current_allocations(self.hass, source)
+        ):
+            return max(1, allocations[0].slots)
+
+        return max(1, bluetooth.async_scanner_count(self.hass, connectable=True))
+
+    def _slot_source(self, device: Device, ble_device: Any = None) -> str | None:
+        """Return the scanner source a connection to the stove goes through."""
+        details = getattr(ble_device, "details", None)
+        if isinstance(details, dict) and details.get("source"):
+            return details["source"]
+        if source := self._selected_sources.get(device.id_device):
+            return source
+
+        return getattr(self._advertisements.get(device.id_device), "source", None)
+
+    def _slot_free(self, source: str | None) -> bool:
+        """Return True when a connection slot of a proxy is free."""
+        return self._slots_in_use.get(source, 0) < self._connection_slot_limit(source)
+
+    def _lru_idle_session(self, source: str | None) -> Device | None:
+        """Return the stove of the least recently used idle session on a proxy."""
+        idle = [
+            session
+            for session in self._sessions.values()
+            if session.slot_source == source
+            and not self._device_lock(session._device).locked()
+        ]
+        if not idle:
+            return None
+
+        return min(idle, key=lambda session: session.last_used)._device
+
+    async def _async_acquire_slot(
+        self, source: str | None, priority: str = SLOT_PRIORITY_POLL
+    ) -> None:
+        """Wait for a free connection slot on a proxy.
+
+        Waiting writes are served before waiting polls. When the proxy is
+        full, the least recently used idle persistent session on it is
+        closed to make room.
+        """
+        stats = self._slot_stats_for(source)
+        waiters = self._slot_waiters.setdefault(
+            source, {SLOT_PRIORITY_WRITE: 0, SLOT_PRIORITY_POLL: 0}
+        )
+        started = time.monotonic()
+        waited = False
+        waiters[priority] += 1
+        try:
+            while True:
+                async with self._slots_changed:
+                    idle = None
+                    if (
+                        priority == SLOT_PRIORITY_WRITE
+                        or not waiters[SLOT_PRIORITY_WRITE]
+                    ):
+                        if self._slot_free(source):
+                            self._slots_in_use[source] = (
+                                self._slots_in_use.get(source, 0) + 1
+                            )
+                            break
+                        idle = self._lru_idle_session(source)
+                    if idle is None:
+                        waited = True
+                        await self._slots_changed.wait()
+                        continue
+
+                _LOGGER.debug(
+                    "Closing idle Micronova BLE session for '%s' to free a slot on %s",
+                    idle.name,
+                    source,
+                )
+                async with self._device_lock(idle):
+                    await self._async_drop_session(idle)
+                stats["evictions"][priority] += 1
+        finally:
+            async with self._slots_changed:
+                waiters[priority] -= 1
+                self._slots_changed.notify_all()
+
+        if waited:
+            elapsed = time.monotonic() - started
+            stats["waits"][priority] += 1
+            stats["wait_seconds"][priority] += elapsed
+            stats["max_wait"] = max(stats["max_wait"], elapsed)
+
+    async def _async_move_slot(self, source: str | None, actual: str | None) -> None:
+        """Charge a held connection slot to the proxy the connection went through."""
+        async with self._slots_changed:
+            self._slots_in_use[source] -= 1
+            self._slots_in_use[actual] = self._slots_in_use.get(actual, 0) + 1
+            self._slots_changed.notify_all()
+
+    def _connected_source(self, client: Any, fallback: str | None) -> str | None:
+        """Return the scanner source Home Assistant connected through.
+
+        Home Assistant's Bleak wrapper picks the scanner itself at connect
+        time, so the source is looked up in the slot allocations. Without
+        the Bluetooth integration the picked source is kept.
+        """
+        try:
+            allocations = bluetooth.async_current_allocations(self.hass) or []
+        except (AttributeError, KeyError):
+            return fallback
+
+        address = str(getattr(client, "address", "") or "").upper()
+        for allocation in allocations:
+            if address in {
+                str(allocated).upper() for allocated in allocation.allocated
+            }:
+                return allocation.source
+
+        return fallback
+
+    async def _async_release_slot(self, source: str | None) -> None:
+        """Free a connection slot of a proxy."""
+        async with self._slots_changed:
+            self._slots_in_use[source] -= 1
+            self._slots_changed.notify_all()
+
+    async def _async_drop_session(self, device: Device) -> None:
+        """Disconnect and forget the persistent session of a device."""
+        session = self._sessions.pop(device.id_device, None)
+        if session is None:
+            return
+
+        try:
+            await session.disconnect()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Ignoring BLE disconnect failure: %s", err)
+
+    async def close(self) -> None:
+        """Close all persistent sessions and stop tracking advertisements."""
+        for task in self._keepalive_tasks.values():
+            task.cancel()
+        self._keepalive_tasks.clear()
+
+        for unsubs in self._advertisement_unsubs.values():
+            for unsub in unsubs:
+                unsub()
+        self._advertisement_unsubs.clear()
+        self._advertisement_targets.clear()
+
+        for device in self.devices:
+            await self._async_drop_session(device)
+
+    @contextlib.asynccontextmanager
+    async def async_paused(self):
+        """Close the links of all stoves and hold off polls and writes.
+
+        Lets another client, such as the options flow validation, connect to
+        the modules and use the connection slots meanwhile.
+        """
+        for task in self._keepalive_tasks.values():
+            task.cancel()
+        self._keepalive_tasks.clear()
+
+        locks = [self._device_lock(device) for device in self.devices]
+        acquired = []
+        try:
+            for lock in locks:
+                await lock.acquire()
+                acquired.append(lock)
+            for device in self.devices:
+                await self._async_drop_session(device)
+            await self._async_session_idle()
+            yield
+        finally:
+            for lock in acquired:
+                lock.release()
+            await self._async_session_idle()
+
+    def _stats(self, device: Device) -> dict[str, Any]:
+        """Return the link statistics of a device."""
+        return self._link_stats.setdefault(
+            device.id_device,
+            {
+                "connects": 0,
+                "commands": {},
+                "read_bytes": 0,
+                "read_seconds": 0.0,
+                "reads": {"full": 0, "partial": 0, "buffers_skipped": 0},
+                "sources": {},
+                "auth": {
+                    "identities": 0,
+                    "nacks": 0,
+                    "lost": 0,
+                    "reidentified": 0,
+                    "reconnected": 0,
+                    "failed": 0,
+                },
+                "writes": {
+                    "primed": 0,
+                    "unprimed": 0,
+                    "nack_primed": 0,
+                    "nack_unprimed": 0,
+                },
+            },
+        )
+
+    def _slot_stats_for(self, source: str | None) -> dict[str, Any]:
+        """Return the connection slot statistics of a proxy."""
+        return self._slot_stats.setdefault(
+            source,
+            {
+                "waits": {SLOT_PRIORITY_WRITE: 0, SLOT_PRIORITY_POLL: 0},
+                "wait_seconds": {SLOT_PRIORITY_WRITE: 0.0, SLOT_PRIORITY_POLL: 0.0},
+                "max_wait": 0.0,
+                "evictions": {SLOT_PRIORITY_WRITE: 0, SLOT_PRIORITY_POLL: 0},
+            },
+        )
+
+    @property
+    def slot_stats(self) -> dict[str, Any]:
+        """Return connection slot use, waits and evictions per proxy source."""
+        return {
+            source or "unknown": {
+                "in_use": self._slots_in_use.get(source, 0),
+                "limit": self._connection_slot_limit(source),
+                "waits": dict(stats["waits"]),
+                "avg_wait": {
+                    priority: round(stats["wait_seconds"][priority] / count, 3)
+                    if count
+                    else None
+                    for priority, count in stats["waits"].items()
+                },
+                "max_wait": round(stats["max_wait"], 3),
+                "evictions": dict(stats["evictions"]),
+            }
+            for source, stats in self._slot_stats.items()
+        }
+
+    def _source_stats(self, device: Device, source: str | None) -> dict[str, Any]:
+        """Return the link statistics of a stove through one scanner source."""
+        return self._stats(device)["sources"].setdefault(
+            source,
+            {
+                "rssi": None,
+                "connects": 0,
+                "connect_failures": 0,
+                "auth_losses": 0,
+                "connect_time": None,
+                "rtt": None,
+                "failure": 0.0,
+            },
+        )
+
+    def _path_cost(self, device: Device, source: str | None) -> float:
+        """Return the cost of reaching a stove through a scanner; lower is better.
+
+        Paths without measurements are ranked by signal strength only.
+        """
+        stats = self._source_stats(device, source)
+        rssi = stats["rssi"] if stats["rssi"] is not None else BLE_PATH_DEFAULT_RSSI
+        seconds = (stats["connect_time"] or 0.0) + (stats["rtt"] or 0.0)
+        return (
+            -rssi
+            + BLE_PATH_SECONDS_COST * seconds
+            + BLE_PATH_FAILURE_COST * stats["failure"]
+        )
+
+    def _record_connect(
+        self, device: Device, source: str | None, elapsed: float | None
+    ) -> None:
+        """Record a connect through a scanner, or a failed one without elapsed."""
+        if elapsed is None:
+            self._record_path_failure(device, source, "connect_failures")
+            return
+
+        stats = self._source_stats(device, source)
+        stats["connects"] += 1
+        stats["connect_time"] = _ewma(stats["connect_time"], elapsed)
+        stats["failure"] = _ewma(stats["failure"], 0.0)
+        self._connected_sources[device.id_device] = source
+
+    def _record_path_failure(
+        self, device: Device, source: str | None, counter: str
+    ) -> None:
+        """Count a failed connect or lost authorization through a scanner."""
+        stats = self._source_stats(device, source)
+        stats[counter] += 1
+        stats["failure"] = _ewma(stats["failure"], 1.0)
+
+    def _record_write(
+        self, device: Device, primed: bool, response_payload: dict[str, Any]
+    ) -> None:
+        """Count writes and rejected writes, split by whether they were primed."""
+        kind = "primed" if primed else "unprimed"
+        writes = self._stats(device)["writes"]
+        writes[kind] += 1
+        if response_payload.get("NackErrCode") is not None:
+            writes[f"nack_{kind}"] += 1
+
+    def _record_rtt(
+        self,
+        device: Device,
+        command: str | None,
+        rtt: float,
+        source: str | None = None,
+    ) -> None:
+        """Record the round trip time of one BLE command."""
+        source_stats = self._source_stats(device, source)
+        source_stats["rtt"] = _ewma(source_stats["rtt"], rtt)
+        stats = self._stats(device)["commands"].setdefault(
+            command or "unknown", {"count": 0, "total": 0.0, "last": 0.0}
+        )
+        stats["count"] += 1
+        stats["total"] += rtt
+        stats["last"] = rtt
+
+    def _record_read(self, device: Device, size: int, elapsed: float) -> None:
+        """Record the bytes and time spent reading one response payload."""
+        stats = self._stats(device)
+        stats["read_bytes"] += size
+        stats["read_seconds"] += elapsed
+
+    @property
+    def link_stats(self) -> dict[str, Any]:
+        """Return connect counts and per-command RTT per device."""
+        return {
+            device_id: {
+                "connects": stats["connects"],
+                "read_bytes_per_second": round(
+                    stats["read_bytes"] / stats["read_seconds"]
+                )
+                if stats["read_seconds"]
+                else None,
+                "reads": dict(stats["reads"]),
+                "writes": dict(stats["writes"]),
+                "auth": dict(stats["auth"]),
+                "rssi": getattr(self._advertisements.get(device_id), "rssi", None),
+                "source": getattr(self._advertisements.get(device_id), "source", None),
+                "sources": {
+                    source or "unknown": {
+                        "rssi": path["rssi"],
+                        "connects": path["connects"],
+                        "connect_failures": path["connect_failures"],
+                        "auth_losses": path["auth_losses"],
+                        "avg_connect_time": _round(path["connect_time"]),
+                        "avg_rtt": _round(path["rtt"]),
+                    }
+                    for source, path in stats["sources"].items()
+                },
+                "commands": {
+                    command: {
+                        "count": rtt["count"],
+                        "last_rtt": round(rtt["last"], 3),
+                        "avg_rtt": round(rtt["total"] / rtt["count"], 3),
+                    }
+                    for command, rtt in stats["commands"].items()
+                },
+            }
+            for device_id, stats in self._link_stats.items()
+        }
+
     def _device_identity_id(self, device: Device) -> str:
         """Return the device id used by the local BLE protocol."""
         value = _normalize_identity_id(device.ble_mac) or _normalize_identity_id(
@@ -444,9 +1140,25 @@ class LocalBleAguaIOT:
             "pl": payload,
         }
 
-    def _make_identity_command(self, device: Device) -> dict[str, Any]:
+    def _encode_command(self, payload: dict[str, Any]) -> bytes:
+        """Return the header and JSON body of an enveloped command."""
+        return _encode_json_message(self._make_enveloped_command(payload))
+
+    def _fixed_command(self, payload: dict[str, Any]) -> bytes:
+        """Return the encoded command, encoding each distinct payload only once.
+
+        The envelope only depends on the session UUID of this transport, so
+        polls and identities are sent from precomputed bytes.
+        """
+        key = tuple(payload.items())
+        message = self._fixed_commands.get(key)
+        if message is None:
+            message = self._fixed_commands[key] = self._encode_command(payload)
+        return message
+
+    def _make_identity_command(self, device: Device) -> bytes:
         """Build the local BLE identity command."""
-        return self._make_enveloped_command(
+        return self._fixed_command(
             {
                 "Id": self._device_identity_id(device),
                 "Security": self._device_security_code(device),
@@ -468,12 +1180,16 @@ class LocalBleAguaIOT:
                 f"available in Home Assistant for '{device.name}'",
             )
 
+        cached_address = self._link(device).get("address")
+        if cached_address:
+            ble_device = self._best_ble_device(device, cached_address)
+            if ble_device is not None:
+                return ble_device, ""
+
         for connectable in (True, False):
             for candidate_address in candidate_addresses:
-                ble_device = bluetooth.async_ble_device_from_address(
-                    self.hass,
-                    candidate_address,
-                    connectable=connectable,
+                ble_device = self._best_ble_device(
+                    device, candidate_address, connectable
                 )
                 if ble_device is not None:
                     _LOGGER.debug(
@@ -538,93 +1254,286 @@ class LocalBleAguaIOT:
             f"expected_name={expected_name})",
         )
 
-    async def _async_get_ble_device(self, device: Device) -> Any:
-        """Resolve the target BLEDevice from Home Assistant's shared scanner."""
-        loop = asyncio.get_running_loop()
-        wait_seconds = min(max(self.buffer_read_timeout, 10), BLE_DISCOVERY_MAX_WAIT)
-        deadline = loop.time() + wait_seconds
-        logged_wait = False
-        last_reason = ""
+    def _track_advertisements(self, device: Device) -> None:
+        """Subscribe to the advertisements of a stove once."""
+        if device.id_device in self._advertisement_unsubs:
+            return
 
-        while True:
-            ble_device, reason = self._find_ble_device(device)
+        addresses = self._candidate_ble_addresses(device)
+        for target in (*addresses, self._expected_local_name(device)):
+            if target:
+                self._advertisement_targets[target] = device.id_device
+
+        if DEFAULT_NAME_PREFIX not in self._advertisement_unsubs:
+            # One shared subscription for any T009 module, used as a fallback
+            # and to match stoves advertising on an unexpected address.
+            self._advertisement_unsubs[DEFAULT_NAME_PREFIX] = [
+                bluetooth.async_register_callback(
+                    self.hass,
+                    self._async_handle_advertisement,
+                    bluetooth.BluetoothCallbackMatcher(
+                        local_name=f"{DEFAULT_NAME_PREFIX}*", connectable=False
+                    ),
+                    bluetooth.BluetoothScanningMode.ACTIVE,
+                )
+            ]
+
+        self._advertisement_unsubs[device.id_device] = [
+            bluetooth.async_register_callback(
+                self.hass,
+                self._async_handle_advertisement,
+                bluetooth.BluetoothCallbackMatcher(address=address, connectable=False),
+                bluetooth.BluetoothScanningMode.ACTIVE,
+            )
+            for address in addresses
+        ]
+
+    @callback
+    def _async_handle_advertisement(self, service_info: Any, change: Any) -> None:
+        """Remember the latest advertisement of the stove it belongs to."""
+        address = service_info.address.upper()
+        name = service_info.name or ""
+
+        id_device = self._advertisement_targets.get(
+            address
+        ) or self._advertisement_targets.get(name)
+        if id_device is not None:
+            self._advertisements[id_device] = service_info
+            for device in self.devices:
+                if device.id_device == id_device:
+                    self._source_stats(device, service_info.source)["rssi"] = (
+                        service_info.rssi
+                    )
+            if event := self._advertisement_events.get(id_device):
+                event.set()
+            return
+
+        if name.startswith(DEFAULT_NAME_PREFIX):
+            self._prefix_advertisement = service_info
+            for event in self._advertisement_events.values():
+                event.set()
+
+    def _tracked_ble_device(self, device: Device) -> Any:
+        """Return the BLEDevice of the last advertisement seen for a stove."""
+        service_info = self._advertisements.get(device.id_device)
+        if service_info is None:
+            service_info = self._prefix_advertisement
+        if service_info is None:
+            return None
+
+        # Ask the bluetooth manager which scanners still see the address; there
+        # are none once the stove stopped advertising.
+        for connectable in (True, False):
+            ble_device = self._best_ble_device(
+                device, service_info.address, connectable
+            )
             if ble_device is not None:
                 return ble_device
 
-            last_reason = reason
-            remaining = deadline - loop.time()
-            if remaining <= 0:
-                raise AguaIOTConnectionError(
-                    f"{last_reason}. Home Assistant will retry once Bluetooth is ready."
-                )
+        return None
 
-            if not logged_wait:
-                _LOGGER.info(
-                    "%s; waiting up to %s seconds before failing this update.",
-                    last_reason,
-                    int(wait_seconds),
-                )
-                logged_wait = True
+    def _best_ble_device(
+        self, device: Device, address: str, connectable: bool = True
+    ) -> Any:
+        """Return the BLEDevice of the scanner with the best path to an address."""
+        scanner_devices = bluetooth.async_scanner_devices_by_address(
+            self.hass, address, connectable=connectable
+        )
+        if not scanner_devices:
+            return None
 
-            await asyncio.sleep(min(BLE_DISCOVERY_RETRY_INTERVAL, remaining))
+        for scanner_device in scanner_devices:
+            self._source_stats(device, scanner_device.scanner.source)["rssi"] = (
+                scanner_device.advertisement.rssi
+            )
+
+        best = min(
+            scanner_devices,
+            key=lambda scanner_device: self._path_cost(
+                device, scanner_device.scanner.source
+            ),
+        )
+        if len(scanner_devices) > 1:
+            _LOGGER.debug(
+                "Using Bluetooth path of '%s' via %s out of %s",
+                device.name,
+                best.scanner.source,
+                [scanner_device.scanner.source for scanner_device in scanner_devices],
+            )
+        self._selected_sources[device.id_device] = best.scanner.source
+        return best.ble_device
+
+    async def _async_get_ble_device(self, device: Device) -> Any:
+        """Resolve the target BLEDevice from Home Assistant's shared scanner."""
+        self._track_advertisements(device)
+        if (ble_device := self._tracked_ble_device(device)) is not None:
+            return ble_device
+
+        ble_device, reason = self._find_ble_device(device)
+        if ble_device is not None:
+            return ble_device
+
+        wait_seconds = deadline_timeout(
+            min(max(self.buffer_read_timeout, 10), BLE_DISCOVERY_MAX_WAIT)
+        )
+        _LOGGER.info(
+            "%s; waiting up to %s seconds before failing this update.",
+            reason,
+            int(wait_seconds),
+        )
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait_seconds
+        event = self._advertisement_events.setdefault(device.id_device, asyncio.Event())
+        with deadline_stage("ble discovery"):
+            while (remaining := deadline - loop.time()) > 0:
+                event.clear()
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if (ble_device := self._tracked_ble_device(device)) is not None:
+                    return ble_device
 
-    def _device_session(self, device: Device) -> "_BleMicronovaSession":
+        raise AguaIOTConnectionError(
+            f"{reason}. Home Assistant will retry once Bluetooth is ready."
+        )
+
+    def _device_session(
+        self, device: Device, priority: str = SLOT_PRIORITY_POLL
+    ) -> "_BleMicronovaSession":
         """Create a BLE session wrapper for one device."""
-        return _BleMicronovaSession(self, device)
+        return _BleMicronovaSession(self, device, priority)
 
 
 class _BleMicronovaSession:
     """Single BLE session used for one read/write sequence."""
 
-    def __init__(self, transport: LocalBleAguaIOT, device: Device) -> None:
+    def __init__(
+        self,
+        transport: LocalBleAguaIOT,
+        device: Device,
+        priority: str = SLOT_PRIORITY_POLL,
+    ) -> None:
         self._transport = transport
         self._device = device
+        self._priority = priority
         self._client: BleakClient | None = None
         self._characteristic_uuid: str | None = None
+        self._characteristic: Any = None
         self._response_ready = asyncio.Event()
         self._notif_len: int | None = None
         self._resolved_target: Any = None
+        self.authenticated = False
+        self.last_used = time.monotonic()
+        self.last_read: float | None = None
+        self._holds_slot = False
+        self.slot_source: str | None = None
+        self._stream_reads = True
 
     async def __aenter__(self) -> "_BleMicronovaSession":
-        await self._transport._command_lock.acquire()
+        lock = self._transport._device_lock(self._device)
+        await lock.acquire()
 
         try:
-            ble_device = await self._transport._async_get_ble_device(self._device)
-            self._resolved_target = ble_device
-            self._client = await establish_connection(
-                BleakClientWithServiceCache,
-                ble_device,
-                self._device.name,
-                max_attempts=3,
-            )
+            await self.connect()
+        except BaseException:
+            lock.release()
+            raise
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            await self.disconnect()
+        finally:
+            self._transport._device_lock(self._device).release()
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True while the GATT link is up."""
+        return self._client is not None and self._client.is_connected
+
+    async def connect(self) -> None:
+        """Connect, resolve the JSON tunnel characteristic and enable notifications."""
+        self.authenticated = False
+        self.last_read = None
+        ble_device = await self._transport._async_get_ble_device(self._device)
+        self._resolved_target = ble_device
+        self.slot_source = self._transport._slot_source(self._device, ble_device)
+        with deadline_stage("ble slot wait"):
+            await self._transport._async_acquire_slot(self.slot_source, self._priority)
+        self._holds_slot = True
+        started = time.monotonic()
+        try:
+            try:
+                with deadline_stage("ble connect"):
+                    self._client = await establish_connection(
+                        BleakClientWithServiceCache,
+                        ble_device,
+                        self._device.name,
+                        max_attempts=3,
+                    )
+            except Exception:
+                self._transport._record_connect(self._device, self.slot_source, None)
+                raise
+            elapsed = time.monotonic() - started
+            source = self._transport._connected_source(self._client, self.slot_source)
+            if source != self.slot_source:
+                _LOGGER.debug(
+                    "Bluetooth connection to '%s' went through %s instead of %s",
+                    self._device.name,
+                    source,
+                    self.slot_source,
+                )
+                await self._transport._async_move_slot(self.slot_source, source)
+                self.slot_source = source
+            self._transport._record_connect(self._device, source, elapsed)
+            self._transport._stats(self._device)["connects"] += 1
             characteristic_uuid = self._resolve_characteristic_uuid()
             self._characteristic_uuid = characteristic_uuid
+            self._characteristic = self._client.services.get_characteristic(
+                characteristic_uuid
+            )
             await self._client.start_notify(characteristic_uuid, self._handle_notify)
-        except AguaIOTConnectionError:
-            await self._cleanup_failed_enter()
+            self._transport._remember_link(
+                self._device, "address", self.connected_address
+            )
+            self._transport._remember_link(
+                self._device, "characteristic", characteristic_uuid
+            )
+        except (AguaIOTConnectionError, asyncio.CancelledError):
+            # A cancelled connect (update deadline, shutdown) must free its slot too.
+            await self._cleanup_failed_connect()
             raise
         except BleakError as err:
-            await self._cleanup_failed_enter()
+            await self._cleanup_failed_connect()
             raise AguaIOTConnectionError(
                 f"Bluetooth connection to '{self._device.name}' failed: {err}"
             ) from err
         except Exception as err:  # noqa: BLE001
-            await self._cleanup_failed_enter()
+            await self._cleanup_failed_connect()
             raise AguaIOTConnectionError(
                 f"Bluetooth connection to '{self._device.name}' failed: {err}"
             ) from err
 
-        return self
-
-    async def _cleanup_failed_enter(self) -> None:
-        """Disconnect and release the command lock after a failed enter."""
+    async def _cleanup_failed_connect(self) -> None:
+        """Disconnect and free the connection slot after a failed connect."""
         try:
             if self._client:
                 await self._client.disconnect()
         finally:
-            self._transport._command_lock.release()
+            await self._release_slot()
 
-    async def __aexit__(self, exc_type, exc, tb) -> None:
+    async def _release_slot(self) -> None:
+        """Return the connection slot held by this session."""
+        if self._holds_slot:
+            self._holds_slot = False
+            await self._transport._async_release_slot(self.slot_source)
+
+    async def disconnect(self) -> None:
+        """Stop notifications and disconnect."""
+        self.authenticated = False
         try:
             if self._client and self._characteristic_uuid:
                 await self._client.stop_notify(self._characteristic_uuid)
@@ -635,7 +1544,7 @@ class _BleMicronovaSession:
                 if self._client:
                     await self._client.disconnect()
             finally:
-                self._transport._command_lock.release()
+                await self._release_slot()
 
     @property
     def connected_address(self) -> str | None:
@@ -668,6 +1577,10 @@ class _BleMicronovaSession:
     def _resolve_characteristic_uuid(self) -> str:
         """Pick the characteristic used as the JSON tunnel."""
         assert self._client is not None
+        cached = self._transport._link(self._device).get("characteristic")
+        if cached and self._client.services.get_characteristic(cached) is not None:
+            return cached
+
         preferred = None
         fallback = None
 
@@ -706,19 +1619,21 @@ class _BleMicronovaSession:
     async def identity(self) -> dict[str, Any]:
         """Authenticate the BLE session."""
         response = await self.exchange(
-            self._transport._make_identity_command(self._device)
+            self._transport._make_identity_command(self._device), "Identity"
         )
+        self._transport._stats(self._device)["auth"]["identities"] += 1
         payload = response.get("pl", {})
         if payload.get("NackErrCode") is not None:
             raise AguaIOTError(
                 f"Bluetooth identity failed for '{self._device.name}' with NackErrCode={payload['NackErrCode']}"
             )
+        self.authenticated = True
         return response
 
     async def get_buffer_ids(self) -> list[int]:
         """Return the list of available buffer ids."""
         response = await self.exchange(
-            self._transport._make_enveloped_command({"Cmd": "GetBufferId"})
+            self._transport._fixed_command({"Cmd": "GetBufferId"}), "GetBufferId"
         )
         payload = response.get("pl", {})
         indexes = payload.get("Indexes") or payload.get("indexes") or []
@@ -728,18 +1643,34 @@ class _BleMicronovaSession:
 
     async def get_buffer_reading(self, buffer_id: int) -> dict[str, Any]:
         """Read one Micronova buffer through BLE."""
-        return await self.exchange(
-            self._transport._make_enveloped_command(
+        response = await self.exchange(
+            self._transport._fixed_command(
                 {"Cmd": "GetBufferReading", "BufferId": int(buffer_id)}
-            )
+            ),
+            "GetBufferReading",
         )
+        self.last_read = time.monotonic()
+        return response
+
+    async def exchange(self, message: bytes, cmd_name: str) -> dict[str, Any]:
+        """Send one encoded JSON command and return its JSON response."""
+        with deadline_stage(f"ble {cmd_name}"):
+            return await self._exchange(message, cmd_name)
+
+    async def _exchange(
+        self, message: bytes, cmd_name: str, fast_write: bool | None = None
+    ) -> dict[str, Any]:
+        """Send one encoded JSON command and wait for its response.
 
-    async def exchange(self, command: dict[str, Any]) -> dict[str, Any]:
-        """Send one JSON command and return its JSON response."""
-        await self._write_json_message(command)
+        Writes are always sent acknowledged: a lost frame of a write cannot
+        be told apart from a write the module applied without notifying.
+        """
+        started = time.monotonic()
+        if fast_write is None:
+            fast_write = cmd_name != "RequestWriting" and self._fast_write_enabled()
+        await self._write_json_message(message, fast_write)
         expected_len = None
-        cmd_name = command.get("pl", {}).get("Cmd")
-        notify_timeout = min(self._transport.buffer_read_timeout, 5)
+        notify_timeout = deadline_timeout(min(self._transport.buffer_read_timeout, 5))
         try:
             await asyncio.wait_for(
                 self._response_ready.wait(),
@@ -747,47 +1678,110 @@ class _BleMicronovaSession:
             )
             expected_len = self._notif_len
         except asyncio.TimeoutError as err:
+            if cmd_name != "RequestWriting":
+                if fast_write:
+                    # Reads are safe to repeat; the module may have dropped
+                    # unacknowledged frames, or only notified late.
+                    _LOGGER.debug(
+                        "No BLE response for '%s' command '%s' after write "
+                        "without response; using acknowledged writes from now on.",
+                        self._device.name,
+                        cmd_name,
+                    )
+                    self._transport._remember_link(self._device, "fast_write", False)
+                    return await self._exchange(message, cmd_name, fast_write=False)
+                raise AguaIOTUpdateError(
+                    f"Bluetooth response timeout while talking to '{self._device.name}'."
+                ) from err
+
+            # The module may apply a write without notifying.
             _LOGGER.debug(
                 "No BLE notification received for '%s' command '%s'; "
                 "falling back to direct characteristic read.",
                 self._device.name,
                 cmd_name,
             )
-            if cmd_name != "RequestWriting":
-                raise AguaIOTUpdateError(
-                    f"Bluetooth response timeout while talking to '{self._device.name}'."
-                ) from err
 
-        response = await self._read_json_response(expected_len)
+        try:
+            response = await self._read_json_response(expected_len)
+        except AguaIOTUpdateError:
+            if fast_write:
+                # A partial body was answered: frames were lost.
+                _LOGGER.debug(
+                    "Incomplete BLE response for '%s' after write without "
+                    "response; using acknowledged writes from now on.",
+                    self._device.name,
+                )
+                self._transport._remember_link(self._device, "fast_write", False)
+            raise
+        payload = response.get("pl")
+        if expected_len is None and (
+            not isinstance(payload, dict) or payload.get("Cmd") != cmd_name
+        ):
+            # The characteristic still holds the answer to an earlier command.
+            raise AguaIOTUpdateError(
+                f"Bluetooth module did not answer '{cmd_name}' for '{self._device.name}'."
+            )
         self._response_ready.clear()
         self._notif_len = None
+        self._transport._record_rtt(
+            self._device, cmd_name, time.monotonic() - started, self.slot_source
+        )
+        if cmd_name != "Identity" and isinstance(payload, dict):
+            if payload.get("NackErrCode") is not None:
+                # The module may have dropped the identity of this link.
+                self.authenticated = False
+                self._transport._stats(self._device)["auth"]["nacks"] += 1
         return response
 
-    async def _write_json_message(self, obj: dict[str, Any]) -> None:
-        """Send the Micronova binary header, then the JSON body."""
-        assert self._client is not None
-        assert self._characteristic_uuid is not None
+    def _fast_write_enabled(self) -> bool:
+        """Return True when chunks may be sent as write-without-response."""
+        if self._characteristic is None:
+            return False
 
-        body = json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
-            "utf-8"
+        properties = {str(prop).lower() for prop in self._characteristic.properties}
+        return (
+            "write-without-response" in properties
+            and self._transport._link(self._device).get("fast_write") is not False
         )
-        header = b"JSON" + struct.pack("<H", len(body)) + b"\xf9\x01"
+
+    async def _write_json_message(
+        self, message: bytes, fast_write: bool = False
+    ) -> None:
+        """Send the Micronova binary header, then the JSON body.
+
+        With fast_write, frames are sent without response except for every
+        BLE_WRITE_WINDOW-th frame and the last one, which are acknowledged so
+        the module can keep up and the message end is confirmed.
+        """
+        assert self._client is not None
+        assert self._characteristic_uuid is not None
 
         self._response_ready.clear()
         self._notif_len = None
 
-        await self._client.write_gatt_char(
-            self._characteristic_uuid, header, response=True
-        )
-
-        mtu = getattr(self._client, "mtu_size", 23) or 23
-        chunk_size = max(20, mtu - 3)
-        for index in range(0, len(body), chunk_size):
-            chunk = body[index : index + chunk_size]
+        if fast_write:
+            chunk_size = max(
+                20,
+                getattr(self._characteristic, "max_write_without_response_size", 20),
+            )
+        else:
+            mtu = getattr(self._client, "mtu_size", 23) or 23
+            chunk_size = max(20, mtu - 3)
+
+        # Slices of the memoryview share the message bytes instead of copying.
+        view = memoryview(message)
+        frames = [view[:JSON_HEADER_SIZE]] + [
+            view[index : index + chunk_size]
+            for index in range(JSON_HEADER_SIZE, len(message), chunk_size)
+        ]
+        for index, frame in enumerate(frames, start=1):
             await self._client.write_gatt_char(
                 self._characteristic_uuid,
-                chunk,
-                response=True,
+                frame,
+                response=not fast_write
+                or index == len(frames)
+                or index % BLE_WRITE_WINDOW == 0,
             )
 
     async def _read_json_response(self, expected_len: int | None) -> dict[str, Any]:
@@ -797,12 +1791,70 @@ class _BleMicronovaSession:
 
         if not expected_len or expected_len <= 0:
             raw = await self._client.read_gatt_char(self._characteristic_uuid)
-            return _parse_json_response(bytes(raw))
+            return _parse_json_response(raw)
+
+        started = time.monotonic()
+        if self._stream_reads:
+            data = await self._read_json_stream(expected_len)
+        else:
+            data = await self._read_json_chunks(expected_len)
+        self._transport._record_read(
+            self._device, len(data), time.monotonic() - started
+        )
 
+        if not data:
+            raise AguaIOTUpdateError(
+                f"Bluetooth read returned no data for '{self._device.name}'."
+            )
+
+        return _parse_json_response(data)
+
+    async def _read_json_stream(self, expected_len: int) -> bytearray:
+        """Read the announced number of bytes into a preallocated buffer.
+
+        The Micronova module only notifies the response length, the payload
+        itself has to be read from the characteristic. Backends that support
+        long reads return up to the full attribute value per call, so most
+        responses complete in one or two reads.
+
+        Only the announced length ends the read. Identical consecutive chunks,
+        such as runs of zero values, are data, unlike in the chunk fallback.
+        """
+        assert self._client is not None
+        buffer = bytearray(expected_len)
+        view = memoryview(buffer)
+        received = 0
+
+        for _ in range(_max_reads(expected_len)):
+            chunk = await self._client.read_gatt_char(self._characteristic_uuid)
+            if not chunk:
+                break
+            size = min(len(chunk), expected_len - received)
+            view[received : received + size] = memoryview(chunk)[:size]
+            received += size
+            if received == expected_len:
+                return buffer
+
+        # The module did not deliver the announced length; use the chunked
+        # fallback for the rest of this session.
+        _LOGGER.debug(
+            "Incomplete BLE stream read for '%s' (%s of %s bytes)",
+            self._device.name,
+            received,
+            expected_len,
+        )
+        self._stream_reads = False
+        del view
+        del buffer[received:]
+        return buffer
+
+    async def _read_json_chunks(self, expected_len: int) -> bytearray:
+        """Read chunks until a repeated or empty chunk, or the announced length."""
+        assert self._client is not None
         data = bytearray()
         last_chunk: bytes | None = None
 
-        for _ in range(32):
+        for _ in range(_max_reads(expected_len)):
             chunk = bytes(await self._client.read_gatt_char(self._characteristic_uuid))
             if not chunk:
                 break
@@ -813,27 +1865,52 @@ class _BleMicronovaSession:
             if len(data) >= expected_len:
                 break
 
-        if not data:
-            raise AguaIOTUpdateError(
-                f"Bluetooth read returned no data for '{self._device.name}'."
-            )
+        del data[expected_len:]
+        return data
+
+
+def _ewma(average: float | None, value: float) -> float:
+    """Return an exponentially weighted moving average updated with a value."""
+    if average is None:
+        return value
+    return average + BLE_PATH_EWMA_ALPHA * (value - average)
+
+
+def _round(value: float | None) -> float | None:
+    """Return a statistic rounded to milliseconds, keeping None."""
+    return round(value, 3) if value is not None else None
+
+
+def _max_reads(expected_len: int) -> int:
+    """Return how many reads a response may take, even at the minimal 20-byte MTU."""
+    return max(32, expected_len // 20 + 1)
+
+
+def _encode_json_message(obj: dict[str, Any]) -> bytes:
+    """Return the Micronova binary header followed by the JSON body."""
+    body = json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return JSON_HEADER.pack(b"JSON", len(body), b"\xf9\x01") + body
 
-        return _parse_json_response(bytes(data[:expected_len]))
 
+def _parse_json_response(raw: bytes | bytearray) -> dict[str, Any]:
+    """Parse a BLE response that may optionally include the Micronova JSON header.
 
-def _parse_json_response(raw: bytes) -> dict[str, Any]:
-    """Parse a BLE response that may optionally include the Micronova JSON header."""
-    if raw.startswith(b"JSON") and len(raw) >= 8:
-        body_len = struct.unpack_from("<H", raw, 4)[0]
-        raw = raw[8 : 8 + body_len]
+    The body is located by offsets, so it is copied only once, by the slice
+    that is decoded.
+    """
+    start = 0
+    end = len(raw)
+    if raw.startswith(b"JSON") and end >= JSON_HEADER_SIZE:
+        start = JSON_HEADER_SIZE
+        end = min(end, start + JSON_HEADER.unpack_from(raw)[1])
 
-    first_json = raw.find(b"{")
+    first_json = raw.find(b"{", start, end)
     if first_json != -1:
-        raw = raw[first_json:]
+        start = first_json
 
     try:
-        return json.loads(raw.decode("utf-8", errors="ignore"))
+        return json.loads(raw[start:end].decode("utf-8", errors="ignore"))
     except json.JSONDecodeError as err:
         raise AguaIOTUpdateError(
-            f"Invalid JSON received from the Micronova BLE transport: {raw[:80]!r}"
+            f"Invalid JSON received from the Micronova BLE transport: {bytes(raw[start : start + 80])!r}"
         ) from err
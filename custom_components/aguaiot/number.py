@@ -16,11 +16,11 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     numbers = []
     for device in agua.devices:
-        hybrid = "power_wood_set" in device.registers
+        hybrid = "power_wood_set" in device.register_keys
 
         for number in NUMBERS:
             if (
-                number.key in device.registers
+                number.key in device.register_keys
                 and (number.force_enabled or device.get_register_enabled(number.key))
                 and (
                     (number.hybrid_only and hybrid)
@@ -64,10 +64,22 @@ class AguaIOTHeatingNumber(CoordinatorEntity, NumberEntity):
             model=self._device.name_product,
         )
 
+    @property
+    def _snapshot(self):
+        """Return the device values the coordinator published last."""
+        return self.coordinator.data[self._device.id_device]
+
+    @property
+    def available(self):
+        """Return False while the stove is offline."""
+        return super().available and self._snapshot.available
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        return self._device.get_register_value(self.entity_description.key)
+        return self._device.get_register_value(
+            self.entity_description.key, snapshot=self._snapshot
+        )
 
     @property
     def native_min_value(self):
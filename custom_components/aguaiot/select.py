@@ -17,7 +17,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     selects = []
     for device in agua.devices:
         for select in SELECTS:
-            if select.key in device.registers and device.get_register_enabled(
+            if select.key in device.register_keys and device.get_register_enabled(
                 select.key
             ):
                 selects.append(AguaIOTHeatingSelect(coordinator, device, select))
@@ -56,9 +56,21 @@ class AguaIOTHeatingSelect(CoordinatorEntity, SelectEntity):
             model=self._device.name_product,
         )
 
+    @property
+    def _snapshot(self):
+        """Return the device values the coordinator published last."""
+        return self.coordinator.data[self._device.id_device]
+
+    @property
+    def available(self):
+        """Return False while the stove is offline."""
+        return super().available and self._snapshot.available
+
     @property
     def current_option(self):
-        return self._device.get_register_value_description(self.entity_description.key)
+        return self._device.get_register_value_description(
+            self.entity_description.key, snapshot=self._snapshot
+        )
 
     @property
     def options(self):
@@ -1,4 +1,9 @@
 import numbers
+import re
+import time
+from decimal import Decimal, InvalidOperation
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
@@ -13,11 +18,11 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
 
     sensors = []
     for device in agua.devices:
-        hybrid = "power_wood_set" in device.registers
+        hybrid = "power_wood_set" in device.register_keys
 
         for sensor in SENSORS:
             if (
-                sensor.key in device.registers
+                sensor.key in device.register_keys
                 and (sensor.force_enabled or device.get_register_enabled(sensor.key))
                 and (
                     (sensor.hybrid_only and hybrid)
@@ -30,6 +35,19 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     async_add_entities(sensors, True)
 
 
+def _register_digits(register):
+    """Return the decimals implied by a register format string or step."""
+    match = re.search(r"\.(\d+)f", register.get("format_string") or "")
+    if match:
+        return int(match.group(1))
+
+    try:
+        exponent = Decimal(str(register.get("step", 1))).normalize().as_tuple()[2]
+    except InvalidOperation:
+        return None
+    return max(0, -exponent) if isinstance(exponent, int) else None
+
+
 class AguaIOTHeatingSensor(CoordinatorEntity, SensorEntity):
     """Sensor entity"""
 
@@ -41,6 +59,89 @@ class AguaIOTHeatingSensor(CoordinatorEntity, SensorEntity):
         self._device = device
         self.entity_description = description
 
+        register = device.get_register(description.key)
+        self._filtered = bool(
+            description.deadband
+            or description.deadband_steps
+            or description.min_interval
+        )
+        self._deadband = description.deadband
+        if self._deadband is None:
+            self._deadband = description.deadband_steps * float(
+                register.get("step") or 1
+            )
+        self._round_digits = _register_digits(register) if self._filtered else None
+        self._last_written = None
+        self._last_available = None
+        self._last_write_time = None
+        self._trailing_write_unsub = None
+
+    async def async_will_remove_from_hass(self):
+        """Cancel a pending trailing write."""
+        self._cancel_trailing_write()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Write state only for significant changes of filtered sensors."""
+        if self._should_write_state():
+            self._cancel_trailing_write()
+            self.async_write_ha_state()
+        else:
+            self.coordinator.suppressed_writes[self.entity_id] += 1
+
+    def _should_write_state(self):
+        """Apply the description deadband and minimum interval.
+
+        A small change suppressed within the interval is written once the
+        interval has passed, so the state does not stay stale once the
+        stove settles and no more coordinator updates arrive.
+        """
+        if not self._filtered:
+            return True
+
+        value = self.native_value
+        available = self.available
+        now = time.monotonic()
+        last = self._last_written
+        if (
+            self._last_write_time is not None
+            and available == self._last_available
+            and isinstance(value, numbers.Number)
+            and isinstance(last, numbers.Number)
+            and abs(value - last) < self._deadband
+        ):
+            interval = self.entity_description.min_interval
+            if value == last or not interval:
+                return False
+            if now - self._last_write_time < interval:
+                self._schedule_trailing_write(self._last_write_time + interval - now)
+                return False
+
+        self._last_written = value
+        self._last_available = available
+        self._last_write_time = now
+        return True
+
+    def _schedule_trailing_write(self, delay):
+        """Check the state again once the minimum interval has passed."""
+        if self._trailing_write_unsub is None:
+            self._trailing_write_unsub = async_call_later(
+                self.hass, delay, self._async_trailing_write
+            )
+
+    @callback
+    def _async_trailing_write(self, _now):
+        """Write a small change that was suppressed within the interval."""
+        self._trailing_write_unsub = None
+        if self._should_write_state():
+            self.async_write_ha_state()
+
+    def _cancel_trailing_write(self):
+        if self._trailing_write_unsub is not None:
+            self._trailing_write_unsub()
+            self._trailing_write_unsub = None
+
     @property
     def unique_id(self):
         """Return a unique ID."""
@@ -61,20 +162,36 @@ class AguaIOTHeatingSensor(CoordinatorEntity, SensorEntity):
             model=self._device.name_product,
         )
 
+    @property
+    def _snapshot(self):
+        """Return the device values the coordinator published last."""
+        return self.coordinator.data[self._device.id_device]
+
+    @property
+    def available(self):
+        """Return False while the stove is offline."""
+        return super().available and self._snapshot.available
+
     @property
     def native_value(self):
         """Return the state of the sensor."""
         if self.entity_description.raw_value:
-            return self._device.get_register_value(self.entity_description.key)
+            value = self._device.get_register_value(
+                self.entity_description.key, snapshot=self._snapshot
+            )
         else:
             value = self._device.get_register_value_description(
-                self.entity_description.key
+                self.entity_description.key, snapshot=self._snapshot
             )
             # Do not return a description if the sensor expects a number
-            if not self.entity_description.native_unit_of_measurement or isinstance(
+            if self.entity_description.native_unit_of_measurement and not isinstance(
                 value, numbers.Number
             ):
-                return value
+                return None
+
+        if self._round_digits is not None and isinstance(value, numbers.Number):
+            return round(value, self._round_digits)
+        return value
 
     @property
     def extra_state_attributes(self):
@@ -85,7 +202,7 @@ class AguaIOTHeatingSensor(CoordinatorEntity, SensorEntity):
         ):
             return {
                 "raw_value": self._device.get_register_value(
-                    self.entity_description.key
+                    self.entity_description.key, snapshot=self._snapshot
                 ),
             }
 
@@ -102,7 +219,7 @@ class AguaIOTHeatingSensor(CoordinatorEntity, SensorEntity):
                 )
             )
             cur_value = self._device.get_register_value_description(
-                self.entity_description.key
+                self.entity_description.key, snapshot=self._snapshot
             )
             if cur_value not in options:
                 options.append(cur_value)
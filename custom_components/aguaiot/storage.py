@@ -0,0 +1,162 @@
+"""Register maps shared by every stove of the same model, and device caches."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import copy
+import hashlib
+import json
+import zlib
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+DATA_REGISTER_MAPS = f"{DOMAIN}_register_maps"
+STORAGE_KEY_REGISTER_MAPS = f"{DOMAIN}.register_maps"
+
+# Register fields holding the last read value instead of the map definition.
+_VALUE_FIELDS = frozenset({"value", "value_raw"})
+
+
+def _compress(register_map: dict[str, Any]) -> str:
+    """Return a register map as base64 encoded zlib compressed JSON."""
+    raw = json.dumps(register_map, separators=(",", ":")).encode("utf-8")
+    return base64.b64encode(zlib.compress(raw, 9)).decode("ascii")
+
+
+def _decompress(value: str | dict[str, Any]) -> dict[str, Any]:
+    """Return a register map stored by `_compress`, or stored as plain JSON."""
+    if isinstance(value, dict):
+        return value
+    return json.loads(zlib.decompress(base64.b64decode(value)))
+
+
+def _digest(register_map: dict[str, Any]) -> str:
+    """Return a hash of a register map definition, ignoring register values."""
+    definition = {
+        key: {field: v for field, v in register.items() if field not in _VALUE_FIELDS}
+        for key, register in register_map.items()
+    }
+    raw = json.dumps(definition, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _map_key(api_url: str, id_registers_map: Any) -> str:
+    """Return the store key of a register map of one cloud."""
+    return f"{api_url.rstrip('/')}|{id_registers_map}"
+
+
+class RegisterMapStore:
+    """Register maps keyed by cloud and `id_registers_map`, stored once per model.
+
+    Device caches only keep a reference to the map id, so a register map of a
+    few hundred kilobytes is neither duplicated per stove nor written into the
+    shared config entries file. Map ids are only unique within one brand
+    cloud, so the API URL is part of the key.
+    """
+
+    def __init__(self, hass: HomeAssistant, compress: bool = True) -> None:
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY_REGISTER_MAPS)
+        self._compress = compress
+        self._stored: dict[str, str | dict[str, Any]] = {}
+        self._maps: dict[str, dict[str, Any]] = {}
+        self._digests: dict[str, str] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    async def async_load(self) -> None:
+        """Load the stored maps once."""
+        async with self._load_lock:
+            if not self._loaded:
+                data = await self._store.async_load() or {}
+                self._stored = data.get("maps", {})
+                self._loaded = True
+
+    def get(self, api_url: str, id_registers_map: Any) -> dict[str, Any] | None:
+        """Return a register map, or None when it is not stored."""
+        key = _map_key(api_url, id_registers_map)
+        if key not in self._maps:
+            stored = self._stored.get(key)
+            if stored is not None:
+                self._maps[key] = _decompress(stored)
+        return self._maps.get(key)
+
+    def put(
+        self, api_url: str, id_registers_map: Any, register_map: dict[str, Any]
+    ) -> None:
+        """Store a register map unless the same definition is stored."""
+        if not register_map:
+            return
+
+        key = _map_key(api_url, id_registers_map)
+        digest = _digest(register_map)
+        if key in self._stored and self._stored_digest(key) == digest:
+            return
+
+        self._maps[key] = register_map
+        self._digests[key] = digest
+        self._stored[key] = _compress(register_map) if self._compress else register_map
+        self._store.async_delay_save(lambda: {"maps": self._stored}, STORAGE_SAVE_DELAY)
+
+    def _stored_digest(self, key: str) -> str:
+        """Return the digest of a stored map, computing it once."""
+        if key not in self._digests:
+            self._digests[key] = _digest(_decompress(self._stored[key]))
+        return self._digests[key]
+
+    def put_devices(self, api_url: str, devices: list[Any]) -> None:
+        """Store the register map of each device model that is new or changed."""
+        for device in devices:
+            self.put(api_url, device.id_registers_map, device.export_register_map())
+
+    def strip(
+        self, api_url: str, cached_devices: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Move the register maps of device cache entries into the store."""
+        stripped = []
+        for entry in cached_devices:
+            entry = dict(entry)
+            if register_map := entry.pop("register_map", None):
+                self.put(api_url, entry["id_registers_map"], register_map)
+            stripped.append(entry)
+        return stripped
+
+    def attach(
+        self, api_url: str, cached_devices: list[dict[str, Any]] | None
+    ) -> list[dict[str, Any]] | None:
+        """Return device cache entries with a copy of their register maps.
+
+        Returns None when a map is missing, so the caller bootstraps again.
+        """
+        if not cached_devices:
+            return None
+
+        attached = []
+        for entry in cached_devices:
+            register_map = entry.get("register_map") or self.get(
+                api_url, entry.get("id_registers_map")
+            )
+            if not register_map:
+                return None
+            # Devices update register dicts in place, so each gets its own copy.
+            attached.append({**entry, "register_map": copy.deepcopy(register_map)})
+        return attached
+
+
+async def async_get_register_maps(hass: HomeAssistant) -> RegisterMapStore:
+    """Return the loaded register map store shared by all config entries."""
+    if DATA_REGISTER_MAPS not in hass.data:
+        hass.data[DATA_REGISTER_MAPS] = RegisterMapStore(hass)
+
+    store = hass.data[DATA_REGISTER_MAPS]
+    await store.async_load()
+    return store
+
+
+def device_cache_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store of the device cache of one config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
@@ -17,7 +17,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
     switches = []
     for device in agua.devices:
         for switch in SWITCHES:
-            if switch.key in device.registers and device.get_register_enabled(
+            if switch.key in device.register_keys and device.get_register_enabled(
                 switch.key
             ):
                 switches.append(AguaIOTHeatingSwitch(coordinator, device, switch))
@@ -56,10 +56,24 @@ class AguaIOTHeatingSwitch(CoordinatorEntity, SwitchEntity):
             model=self._device.name_product,
         )
 
+    @property
+    def _snapshot(self):
+        """Return the device values the coordinator published last."""
+        return self.coordinator.data[self._device.id_device]
+
+    @property
+    def available(self):
+        """Return False while the stove is offline."""
+        return super().available and self._snapshot.available
+
     @property
     def is_on(self):
         """Return the state of the sensor."""
-        return bool(self._device.get_register_value(self.entity_description.key))
+        return bool(
+            self._device.get_register_value(
+                self.entity_description.key, snapshot=self._snapshot
+            )
+        )
 
     async def async_turn_off(self):
         """Turn device off."""
@@ -0,0 +1,339 @@
+"""Benchmark the local BLE transport against a fake Micronova GATT peripheral.
+
+The fake peripheral speaks the Micronova JSON-over-GATT protocol used by the
+T009/Navel modules: a `JSON` header frame followed by the JSON body, a 2-byte
+length notification once the response is ready, and chunked reads of the
+response. Buffer contents come from the register dumps in `fixtures/`.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python scripts/ble_benchmark.py fixtures/nobis_water.json --polls 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import struct
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.aguaiot import local_ble  # noqa: E402
+
+ADDRESS = "AA:BB:CC:DD:EE:01"
+SECURITY_CODE = "1234"
+ATT_MAX_VALUE = 512
+
+
+class FakeCharacteristic:
+    """The JSON tunnel characteristic of the fake module."""
+
+    def __init__(self, peripheral: FakeMicronovaPeripheral) -> None:
+        self.uuid = local_ble.DEFAULT_CHAR_UUID
+        self.properties = ["read", "write", "notify"]
+        if peripheral.write_without_response:
+            self.properties.append("write-without-response")
+        self.max_write_without_response_size = peripheral.mtu_size - 3
+
+
+class FakeServices:
+    """Minimal BleakGATTServiceCollection replacement."""
+
+    def __init__(self, peripheral: FakeMicronovaPeripheral) -> None:
+        self.characteristic = FakeCharacteristic(peripheral)
+        self.service = SimpleNamespace(
+            uuid=local_ble.DEFAULT_SERVICE_UUID, characteristics=[self.characteristic]
+        )
+
+    def __iter__(self):
+        return iter([self.service])
+
+    def get_characteristic(self, uuid: str):
+        return self.characteristic if uuid == self.characteristic.uuid else None
+
+
+class FakeMicronovaPeripheral:
+    """BleakClient look-alike answering Micronova JSON commands from a fixture."""
+
+    def __init__(
+        self,
+        register_map: dict,
+        *,
+        mtu: int = 185,
+        latency: float = 0.0,
+        drop_rate: float = 0.0,
+        notify_drop_rate: float = 0.0,
+        long_reads: bool = True,
+        write_without_response: bool = True,
+        items_per_buffer: int = 64,
+        seed: int | None = None,
+    ) -> None:
+        self.address = ADDRESS
+        self.mtu_size = mtu
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.notify_drop_rate = notify_drop_rate
+        self.long_reads = long_reads
+        self.write_without_response = write_without_response
+        self.is_connected = False
+        self.services = FakeServices(self)
+        self.counters = {"writes": 0, "dropped_writes": 0, "reads": 0, "commands": 0}
+
+        self._random = random.Random(seed)
+        self._notify = None
+        self._incoming = bytearray()
+        self._expected = None
+        self._response = b""
+        self._response_pos = 0
+        self._authenticated = False
+
+        self.values: dict[int, int] = {}
+        for register in register_map.values():
+            try:
+                value = int(register.get("value_raw"))
+            except (TypeError, ValueError):
+                continue
+            offset = int(register["offset"])
+            self.values[offset] = self.values.get(offset, 0) | value
+
+        offsets = sorted(self.values)
+        self.buffers = {
+            index + 1: offsets[start : start + items_per_buffer]
+            for index, start in enumerate(range(0, len(offsets), items_per_buffer))
+        }
+
+    async def connect(self) -> None:
+        await self._delay()
+        self.is_connected = True
+        self._authenticated = False
+
+    async def disconnect(self) -> None:
+        self.is_connected = False
+
+    async def start_notify(self, _uuid: str, callback) -> None:
+        await self._delay()
+        self._notify = callback
+
+    async def stop_notify(self, _uuid: str) -> None:
+        self._notify = None
+
+    async def write_gatt_char(self, _uuid: str, data, response: bool = True) -> None:
+        self.counters["writes"] += 1
+        if response:
+            await self._delay()
+        elif self._random.random() < self.drop_rate:
+            # The module buffer overflowed and the frame was lost.
+            self.counters["dropped_writes"] += 1
+            return
+
+        data = bytes(data)
+        if self._expected is None:
+            if not data.startswith(b"JSON") or len(data) < 8:
+                return
+            self._expected = struct.unpack_from("<H", data, 4)[0]
+            self._incoming = bytearray(data[8:])
+        else:
+            self._incoming.extend(data)
+
+        if len(self._incoming) >= self._expected:
+            body = bytes(self._incoming[: self._expected])
+            self._expected = None
+            self._incoming = bytearray()
+            asyncio.get_running_loop().create_task(self._answer(body))
+
+    async def read_gatt_char(self, _uuid: str) -> bytearray:
+        self.counters["reads"] += 1
+        await self._delay()
+        size = ATT_MAX_VALUE if self.long_reads else self.mtu_size - 1
+        chunk = self._response[self._response_pos : self._response_pos + size]
+        self._response_pos += len(chunk)
+        return bytearray(chunk)
+
+    async def _answer(self, body: bytes) -> None:
+        self.counters["commands"] += 1
+        command = json.loads(body)
+        payload = self._handle(command.get("pl", {}))
+        response = {
+            "mt": "R",
+            "s": {"ss": "Navel"},
+            "r": command.get("s"),
+            "pl": payload,
+        }
+        self._response = json.dumps(response, separators=(",", ":")).encode()
+        self._response_pos = 0
+
+        await self._delay()
+        if self._notify is not None and self._random.random() >= self.notify_drop_rate:
+            self._notify(None, bytearray(struct.pack("<H", len(self._response))))
+
+    def _handle(self, payload: dict) -> dict:
+        cmd = payload.get("Cmd")
+        if cmd == "Identity":
+            self._authenticated = payload.get("Security") == SECURITY_CODE
+            return (
+                {"Cmd": cmd} if self._authenticated else {"Cmd": cmd, "NackErrCode": 1}
+            )
+
+        if not self._authenticated:
+            return {"Cmd": cmd, "NackErrCode": 2}
+
+        if cmd == "GetBufferId":
+            return {"Cmd": cmd, "Indexes": list(self.buffers)}
+
+        if cmd == "GetBufferReading":
+            items = self.buffers.get(payload.get("BufferId"), [])
+            return {
+                "Cmd": cmd,
+                "BufferId": payload.get("BufferId"),
+                "Items": items,
+                "Values": [self.values[item] for item in items],
+            }
+
+        if cmd == "RequestWriting":
+            for item, mask, value in zip(
+                payload["Items"], payload["Masks"], payload["Values"]
+            ):
+                self.values[item] = (self.values.get(item, 0) & ~mask) | (value & mask)
+            return {"Cmd": cmd, "Result": "OK"}
+
+        return {"Cmd": cmd, "NackErrCode": 3}
+
+    async def _delay(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+
+def build_transport(peripheral, register_map, persistent_session):
+    """Create a LocalBleAguaIOT talking to the fake peripheral."""
+    hass = SimpleNamespace(
+        async_create_background_task=lambda coro, name, eager_start=True: (
+            asyncio.get_running_loop().create_task(coro, name=name)
+        )
+    )
+    transport = local_ble.LocalBleAguaIOT(
+        hass,
+        "https://localhost",
+        "customer",
+        "user@example.com",
+        "password",
+        "benchmark",
+        persistent_session=persistent_session,
+    )
+    transport.load_cached_devices(
+        [
+            {
+                "id": 1,
+                "id_device": "benchmark",
+                "id_product": "benchmark",
+                "product_serial": ADDRESS,
+                "name": "Fake stove",
+                "is_online": True,
+                "name_product": "Fake stove",
+                "id_registers_map": 1,
+                "device_info": {"mac": ADDRESS, "security_code": SECURITY_CODE},
+                "register_map": register_map,
+            }
+        ]
+    )
+
+    async def get_ble_device(device):
+        return SimpleNamespace(address=ADDRESS, name="T009_DDEE01")
+
+    async def establish_connection(client_class, ble_device, name, **kwargs):
+        await peripheral.connect()
+        return peripheral
+
+    transport._async_get_ble_device = get_ble_device
+    transport._connection_slot_limit = lambda source=None: 1
+    local_ble.establish_connection = establish_connection
+    return transport
+
+
+async def run(args) -> None:
+    register_map = json.loads(Path(args.fixture).read_text())
+    peripheral = FakeMicronovaPeripheral(
+        register_map,
+        mtu=args.mtu,
+        latency=args.latency,
+        drop_rate=args.drop_rate,
+        notify_drop_rate=args.notify_drop_rate,
+        long_reads=not args.short_reads,
+        write_without_response=not args.no_write_without_response,
+        seed=args.seed,
+    )
+    transport = build_transport(peripheral, register_map, args.persistent)
+    device = transport.devices[0]
+
+    setups = []
+    for _ in range(args.setups):
+        started = time.perf_counter()
+        async with transport._device_session(device) as session:
+            await session.identity()
+        setups.append(time.perf_counter() - started)
+
+    polls = []
+    cpu_started = time.process_time()
+    for _ in range(args.polls):
+        started = time.perf_counter()
+        await device.update()
+        polls.append(time.perf_counter() - started)
+    cpu = time.process_time() - cpu_started
+
+    await transport.close()
+
+    print(
+        f"registers:     {len(device.snapshot.values)} values in {len(peripheral.buffers)} buffers"
+    )
+    print(
+        f"session setup: {1000 * sum(setups) / len(setups):.3f} ms avg over {len(setups)}"
+    )
+    print(
+        f"poll:          {1000 * sum(polls) / len(polls):.3f} ms avg over {len(polls)}"
+    )
+    print(f"poll cpu:      {1000 * cpu / len(polls):.3f} ms avg")
+    print(f"peripheral:    {peripheral.counters}")
+    print(json.dumps(transport.link_stats, indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture", help="register dump from the fixtures directory")
+    parser.add_argument("--polls", type=int, default=20)
+    parser.add_argument("--setups", type=int, default=5)
+    parser.add_argument("--mtu", type=int, default=185)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds per GATT operation"
+    )
+    parser.add_argument(
+        "--drop-rate",
+        type=float,
+        default=0.0,
+        help="share of lost write-without-response frames",
+    )
+    parser.add_argument(
+        "--notify-drop-rate",
+        type=float,
+        default=0.0,
+        help="share of lost length notifications",
+    )
+    parser.add_argument(
+        "--short-reads",
+        action="store_true",
+        help="return one MTU per read instead of long reads",
+    )
+    parser.add_argument("--no-write-without-response", action="store_true")
+    parser.add_argument(
+        "--persistent", action="store_true", help="keep the session open between polls"
+    )
+    parser.add_argument("--seed", type=int)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
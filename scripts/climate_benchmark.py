@@ -0,0 +1,104 @@
+"""Measure the state write cost of the climate entities of a fixture.
+
+Reads every property Home Assistant's climate platform reads when
+`async_write_ha_state` runs. This is timed for repeated writes of the same
+snapshot (the memoized path), and for writes where every write follows a new
+snapshot.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python scripts/climate_benchmark.py fixtures/nobis_canalization.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from setup_benchmark import build_entry, patch_entity_platform  # noqa: E402
+from custom_components.aguaiot import climate  # noqa: E402
+
+STATE_PROPERTIES = (
+    "available",
+    "supported_features",
+    "hvac_mode",
+    "hvac_modes",
+    "hvac_action",
+    "current_temperature",
+    "target_temperature",
+    "target_temperature_step",
+    "min_temp",
+    "max_temp",
+    "fan_mode",
+    "fan_modes",
+    "preset_mode",
+    "preset_modes",
+)
+
+
+def write_state(entity) -> None:
+    """Read the properties a climate state write reads."""
+    for name in STATE_PROPERTIES:
+        getattr(entity, name, None)
+
+
+async def climate_entities(entry) -> list:
+    """Return the climate entities set up for the entry."""
+    patch_entity_platform()
+    entities = []
+    await climate.async_setup_entry(
+        None, entry, lambda new, update=False: entities.extend(new)
+    )
+    return entities
+
+
+def run(args) -> None:
+    register_map = json.loads(Path(args.fixture).read_text())
+    entry = build_entry(register_map)
+    coordinator = entry.runtime_data
+    device = coordinator.agua.devices[0]
+    entities = asyncio.run(climate_entities(entry))
+    values = device.snapshot.information
+
+    def new_snapshot() -> None:
+        # Touch an offset no entity reads, so only the generation changes.
+        device.set_information({**values, -1: device.generation})
+        coordinator.data = {device.id_device: device.snapshot}
+
+    print(f"entities: {', '.join(type(entity).__name__ for entity in entities)}")
+    for entity in entities:
+        same = timeit.repeat(
+            lambda: write_state(entity), number=args.number, repeat=args.repeat
+        )
+        changed = timeit.repeat(
+            lambda: (new_snapshot(), write_state(entity)),
+            number=args.number,
+            repeat=args.repeat,
+        )
+        snapshot_only = timeit.repeat(
+            new_snapshot, number=args.number, repeat=args.repeat
+        )
+        print(
+            f"{type(entity).__name__ + ':':28}"
+            f"{1e6 * min(same) / args.number:8.2f} us same snapshot, "
+            f"{1e6 * (min(changed) - min(snapshot_only)) / args.number:8.2f} us "
+            "new snapshot"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture", help="register dump from the fixtures directory")
+    parser.add_argument("--number", type=int, default=2000, help="writes per repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
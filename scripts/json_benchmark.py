@@ -0,0 +1,98 @@
+"""Measure the encode and decode cost of the BLE JSON commands.
+
+Times the fixed poll commands (cached per transport after the first call and
+encoded from scratch), a RequestWriting command, which is encoded per write,
+and the parsing of the GetBufferReading responses the fake peripheral of
+`ble_benchmark.py` sends for a fixture.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python scripts/json_benchmark.py fixtures/nobis_water.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ble_benchmark import FakeMicronovaPeripheral, build_transport  # noqa: E402
+from custom_components.aguaiot import local_ble  # noqa: E402
+
+
+async def read_responses(peripheral, transport) -> list[bytearray]:
+    """Return the raw GetBufferReading response of every fake buffer."""
+    peripheral._authenticated = True
+    responses = []
+    for buffer_id in peripheral.buffers:
+        message = transport._fixed_command(
+            {"Cmd": "GetBufferReading", "BufferId": buffer_id}
+        )
+        await peripheral._answer(message[local_ble.JSON_HEADER_SIZE :])
+        responses.append(bytearray(peripheral._response))
+    return responses
+
+
+def measure(func, number: int, repeat: int) -> float:
+    """Return the best time of one call, in microseconds."""
+    return 1e6 * min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def run(args) -> None:
+    register_map = json.loads(Path(args.fixture).read_text())
+    peripheral = FakeMicronovaPeripheral(register_map)
+    transport = build_transport(peripheral, register_map, False)
+    device = transport.devices[0]
+    responses = asyncio.run(read_responses(peripheral, transport))
+
+    poll = {"Cmd": "GetBufferReading", "BufferId": 1}
+    keys = [
+        key
+        for key, register in register_map.items()
+        if key.endswith("_set") and "offset" in register and "mask" in register
+    ][: args.write_items]
+    write = {
+        "Cmd": "RequestWriting",
+        "Protocol": "RWMSmaster",
+        "BitData": [8] * len(keys),
+        "Endianess": ["L"] * len(keys),
+        "Items": [int(register_map[key]["offset"]) for key in keys],
+        "Masks": [int(register_map[key]["mask"]) for key in keys],
+        "Values": [1] * len(keys),
+    }
+
+    timings = {
+        "encode poll (cached)": lambda: transport._fixed_command(poll),
+        "encode poll (uncached)": lambda: transport._encode_command(poll),
+        "encode identity": lambda: transport._make_identity_command(device),
+        f"encode write ({len(keys)} items)": lambda: transport._encode_command(write),
+        "decode all responses": lambda: [
+            local_ble._parse_json_response(response) for response in responses
+        ],
+    }
+
+    sizes = [len(response) for response in responses]
+    print(
+        f"responses:  {len(responses)} buffers, {sum(sizes)} bytes, "
+        f"{max(sizes)} bytes max"
+    )
+    for name, func in timings.items():
+        print(f"{name + ':':28}{measure(func, args.number, args.repeat):9.2f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("fixture", help="register dump from the fixtures directory")
+    parser.add_argument("--number", type=int, default=2000, help="calls per repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--write-items", type=int, default=1)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
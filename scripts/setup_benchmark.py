@@ -0,0 +1,138 @@
+"""Measure the platform setup cost over the register dumps in `fixtures/`.
+
+Every fixture is restored as a cached device and set up by each platform's
+`async_setup_entry`, the way Home Assistant does after the first refresh.
+The canalization matching of the climate platform is timed on its own as
+well.
+
+Run from the repository root in a Home Assistant development environment:
+
+    python scripts/setup_benchmark.py --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.aguaiot import (  # noqa: E402
+    binary_sensor,
+    climate,
+    number,
+    select,
+    sensor,
+    switch,
+)
+from custom_components.aguaiot.aguaiot import aguaiot  # noqa: E402
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+PLATFORMS = (climate, sensor, binary_sensor, number, select, switch)
+
+
+def build_entry(register_map: dict) -> SimpleNamespace:
+    """Return a config entry whose coordinator holds the fixture as a device."""
+    client = aguaiot(
+        "https://localhost", "customer", "user@example.com", "password", "benchmark"
+    )
+    client.load_cached_devices(
+        [
+            {
+                "id": 1,
+                "id_device": "benchmark",
+                "id_product": "benchmark",
+                "product_serial": "benchmark",
+                "name": "Fake stove",
+                "is_online": True,
+                "name_product": "Fake stove",
+                "id_registers_map": 1,
+                "register_map": register_map,
+            }
+        ]
+    )
+
+    values = {}
+    for register in register_map.values():
+        try:
+            value = int(register.get("value_raw"))
+        except (TypeError, ValueError):
+            continue
+        offset = int(register["offset"])
+        values[offset] = values.get(offset, 0) | value
+    device = client.devices[0]
+    device.set_information(values)
+
+    coordinator = SimpleNamespace(
+        agua=client,
+        data={device.id_device: device.snapshot},
+        last_update_success=True,
+    )
+    return SimpleNamespace(runtime_data=coordinator)
+
+
+async def setup(entry: SimpleNamespace) -> list:
+    """Run the setup of every platform and return the created entities."""
+    entities = []
+    for platform in PLATFORMS:
+        await platform.async_setup_entry(
+            None, entry, lambda new, update=False: entities.extend(new)
+        )
+    return entities
+
+
+def patch_entity_platform() -> None:
+    """Let the climate setup register its entity service outside a platform."""
+    service_platform = SimpleNamespace(
+        async_register_entity_service=lambda *args, **kwargs: None
+    )
+    climate.entity_platform = SimpleNamespace(
+        async_get_current_platform=lambda: service_platform
+    )
+
+
+async def run(args) -> None:
+    patch_entity_platform()
+    entries = [
+        build_entry(json.loads(path.read_text()))
+        for path in sorted(FIXTURES.glob("*.json"))
+    ]
+
+    setups = []
+    matching = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        entity_count = 0
+        for entry in entries:
+            entity_count += len(await setup(entry))
+        setups.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for entry in entries:
+            list(climate._match_canalizations(entry.runtime_data.agua.devices[0]))
+        matching.append(time.perf_counter() - started)
+
+    print(f"fixtures:      {len(entries)}, {entity_count} entities")
+    print(
+        f"setup:         {1000 * min(setups):.3f} ms for all fixtures "
+        f"(best of {args.repeat})"
+    )
+    print(
+        f"canalizations: {1000 * min(matching):.3f} ms for all fixtures "
+        f"(best of {args.repeat})"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Tests for the Micronova Agua IOT integration."""
@@ -0,0 +1,111 @@
+"""Helpers for the Micronova Agua IOT tests."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import jwt
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures"
+
+API_URL = "https://cloud.example.com"
+
+
+def load_fixture(name: str) -> dict[str, Any]:
+    """Return a register dump from the fixtures directory."""
+    return json.loads((FIXTURES / f"{name}.json").read_text())
+
+
+def cached_device(
+    register_map: dict[str, Any], id_device: str = "device1", **kwargs: Any
+) -> dict[str, Any]:
+    """Return a device cache entry as exported by `Device.export_cache`."""
+    return {
+        "id": 1,
+        "id_device": id_device,
+        "id_product": "product1",
+        "product_serial": "serial1",
+        "name": "Stove",
+        "is_online": True,
+        "name_product": "Stove",
+        "id_registers_map": 1,
+        "device_info": {},
+        "register_map": register_map,
+        **kwargs,
+    }
+
+
+class FakeResponse:
+    """httpx.Response look-alike."""
+
+    def __init__(self, status_code: int, data: Any = None) -> None:
+        self.status_code = status_code
+        self._data = data
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self._data)
+
+    def json(self) -> Any:
+        return self._data
+
+
+class FakeCloud:
+    """httpx.AsyncClient look-alike answering the Agua IOT cloud API.
+
+    Records the path of every call, and completes jobs on the first status
+    request.
+    """
+
+    def __init__(self, devices: list[dict[str, Any]] | None = None) -> None:
+        self.calls: list[str] = []
+        self.devices = devices or []
+        self.device_list_status = 200
+        self.writes: list[dict[str, Any]] = []
+        self.values: dict[int, int] = {}
+
+    async def __aenter__(self) -> FakeCloud:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def post(self, url: str, json: Any = None, **kwargs: Any) -> FakeResponse:
+        path = url.removeprefix(API_URL)
+        self.calls.append(path)
+        if path == "/appSignup":
+            return FakeResponse(201, {})
+        if path == "/userLogin":
+            token = jwt.encode({"exp": int(time.time()) + 3600}, "secret")
+            return FakeResponse(200, {"token": token, "refresh_token": "refresh"})
+        if path == "/deviceList":
+            return FakeResponse(self.device_list_status, {"device": self.devices})
+        if path == "/deviceRequestWriting":
+            self.writes.append(json)
+            return FakeResponse(200, {"idRequest": "write"})
+        if path == "/deviceGetBufferReading":
+            return FakeResponse(200, {"idRequest": "read"})
+        return FakeResponse(404)
+
+    async def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        path = url.removeprefix(API_URL)
+        self.calls.append(path)
+        if path == "/deviceJobStatus/write":
+            return FakeResponse(
+                200, {"jobAnswerStatus": "completed", "jobAnswerData": {"Cmd": 1}}
+            )
+        if path == "/deviceJobStatus/read":
+            return FakeResponse(
+                200,
+                {
+                    "jobAnswerStatus": "completed",
+                    "jobAnswerData": {
+                        "Items": list(self.values),
+                        "Values": list(self.values.values()),
+                    },
+                },
+            )
+        return FakeResponse(404)
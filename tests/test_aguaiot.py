@@ -0,0 +1,114 @@
+"""Tests for the Agua IOT cloud client."""
+
+import asyncio
+
+import pytest
+
+from custom_components.aguaiot.aguaiot import (
+    PRIORITY_POLL,
+    PRIORITY_WRITE,
+    AguaIOTPreempted,
+    OperationScheduler,
+    aguaiot,
+)
+
+from .common import API_URL, FakeCloud, cached_device, load_fixture
+
+
+def _restored_client(cloud: FakeCloud) -> aguaiot:
+    """Return a client with devices restored from cache, not logged in."""
+    client = aguaiot(
+        API_URL, "customer", "email", "password", "uuid", async_client=cloud
+    )
+    client.load_cached_devices([cached_device(load_fixture("nobis_water"))])
+    return client
+
+
+async def test_write_before_connect_logs_in() -> None:
+    """A write on a restored client logs in before sending the job."""
+    cloud = FakeCloud()
+    client = _restored_client(cloud)
+
+    await client.devices[0].set_register_value("calendar_day_set", 12)
+
+    assert cloud.calls[:3] == ["/appSignup", "/userLogin", "/deviceRequestWriting"]
+    assert cloud.writes[0]["Values"] == [12]
+    assert client.token is not None
+
+
+async def test_failed_online_refresh_keeps_state() -> None:
+    """A failing device list keeps the online state and still reads values."""
+    cloud = FakeCloud()
+    cloud.device_list_status = 500
+    client = _restored_client(cloud)
+
+    await client.update()
+
+    assert client.devices[0].available
+    assert "/deviceGetBufferReading" in cloud.calls
+    assert client.online_stats["refresh_errors"] == 1
+
+
+async def test_prefetch_does_not_outlive_a_write() -> None:
+    """A read job submitted while a write waits is not collected after it."""
+    cloud = FakeCloud()
+    client = _restored_client(cloud)
+    device = client.devices[0]
+
+    submitting = asyncio.Event()
+    release = asyncio.Event()
+    submit = client._submit_buffer_read
+
+    async def slow_submit(dev):
+        submitting.set()
+        await release.wait()
+        return await submit(dev)
+
+    client._submit_buffer_read = slow_submit
+    prefetch = asyncio.create_task(client.prefetch_device_information())
+    await submitting.wait()
+    write = asyncio.create_task(device.set_register_value("calendar_day_set", 12))
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(prefetch, write)
+
+    assert device.id_device not in client._read_jobs
+
+
+async def test_unread_registers_drop_out_of_used_offsets() -> None:
+    """A register no entity read since the last reset is no longer used."""
+    device = _restored_client(FakeCloud()).devices[0]
+    register_map = load_fixture("nobis_water")
+
+    device.get_register_value("status_get")
+    device.get_register_value("giri_estrattore_get")
+    device.reset_used_registers()
+    device.get_register_value("status_get")
+    device.reset_used_registers()
+
+    assert device.used_offsets == {register_map["status_get"]["offset"]}
+
+    # Without any read since the last reset, the used registers are kept.
+    device.reset_used_registers()
+    assert device.used_offsets == {register_map["status_get"]["offset"]}
+
+
+async def test_write_preempts_running_poll() -> None:
+    """A write cancels a running preemptible poll and runs right away."""
+    scheduler = OperationScheduler()
+    polling_started = asyncio.Event()
+
+    async def poll():
+        polling_started.set()
+        await asyncio.sleep(10)
+
+    async def write():
+        return "written"
+
+    polling = asyncio.create_task(scheduler.run(PRIORITY_POLL, poll, preemptible=True))
+    await polling_started.wait()
+
+    assert await scheduler.run(PRIORITY_WRITE, write) == "written"
+    with pytest.raises(AguaIOTPreempted):
+        await polling
+    assert scheduler.stats["poll"]["preempted"] == 1
@@ -0,0 +1,25 @@
+"""Tests for the config entry lifecycle."""
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.aguaiot import async_remove_entry
+from custom_components.aguaiot.const import DOMAIN
+
+
+async def test_remove_entry_deletes_device_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Removing an entry deletes its device cache file."""
+    entry = MockConfigEntry(domain=DOMAIN, entry_id="entry1")
+    hass_storage[f"{DOMAIN}.entry1"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.entry1",
+        "data": {"devices": []},
+    }
+
+    await async_remove_entry(hass, entry)
+
+    assert f"{DOMAIN}.entry1" not in hass_storage
@@ -0,0 +1,122 @@
+"""Tests for the Bluetooth transport, against the fake Micronova peripheral."""
+
+import asyncio
+
+import pytest
+
+from custom_components.aguaiot import local_ble
+from scripts.ble_benchmark import FakeMicronovaPeripheral, build_transport
+
+from .common import load_fixture
+
+
+@pytest.fixture(autouse=True)
+def restore_establish_connection(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Undo the establish_connection replacement of `build_transport`."""
+    monkeypatch.setattr(
+        local_ble, "establish_connection", local_ble.establish_connection
+    )
+
+
+def _stove(fixture: str = "nobis_water", persistent: bool = False, **kwargs):
+    """Return a fake peripheral and the transport and device talking to it."""
+    register_map = load_fixture(fixture)
+    peripheral = FakeMicronovaPeripheral(register_map, seed=1, **kwargs)
+    transport = build_transport(peripheral, register_map, persistent)
+    return peripheral, transport, transport.devices[0]
+
+
+def _record_commands(peripheral: FakeMicronovaPeripheral) -> list[str]:
+    """Return the list the peripheral appends each answered command to."""
+    commands = []
+    handle = peripheral._handle
+
+    def recording_handle(payload):
+        commands.append(payload.get("Cmd"))
+        return handle(payload)
+
+    peripheral._handle = recording_handle
+    return commands
+
+
+async def test_persistent_session_is_reused_and_reconnects() -> None:
+    """Polls share one link, and a dropped link is reconnected on next use."""
+    peripheral, transport, device = _stove(persistent=True)
+    commands = _record_commands(peripheral)
+    try:
+        await device.update()
+        await device.update()
+        assert transport.link_stats[device.id_device]["connects"] == 1
+        assert commands.count("Identity") == 1
+
+        await peripheral.disconnect()
+        await device.update()
+        assert transport.link_stats[device.id_device]["connects"] == 2
+        assert commands.count("Identity") == 2
+        assert device.snapshot.values
+    finally:
+        await transport.close()
+
+
+async def test_lost_fast_write_frames() -> None:
+    """Lost unacknowledged frames turn fast write off, and writes are applied."""
+    peripheral, transport, device = _stove(drop_rate=1.0)
+    transport.buffer_read_timeout = 0.1
+    register = device.get_register("calendar_day_set")
+    try:
+        await device.set_register_value("calendar_day_set", 12)
+    finally:
+        await transport.close()
+
+    assert transport._link(device)["fast_write"] is False
+    assert peripheral.values[register["offset"]] & register["mask"] == 12
+
+
+async def test_write_goes_before_queued_poll() -> None:
+    """A write waiting behind a running poll goes before a poll queued earlier."""
+    peripheral, transport, device = _stove(latency=0.01)
+    commands = _record_commands(peripheral)
+    try:
+        running = asyncio.create_task(device.update())
+        await asyncio.sleep(0)
+        queued = asyncio.create_task(device.update())
+        write = asyncio.create_task(device.set_register_value("calendar_day_set", 12))
+        await asyncio.gather(running, queued, write)
+    finally:
+        await transport.close()
+
+    after_write = commands[commands.index("RequestWriting") + 1 :]
+    assert commands[: commands.index("RequestWriting")].count("GetBufferReading") >= 1
+    assert after_write.count("GetBufferReading") == 1
+
+
+async def test_plan_buffer_reads_full_and_partial() -> None:
+    """Only buffers with used registers are read, with a periodic full read."""
+    peripheral, transport, device = _stove("piazzetta_multifire", items_per_buffer=16)
+    register_map = load_fixture("piazzetta_multifire")
+    buffer_ids = list(peripheral.buffers)
+    assert len(buffer_ids) > 2
+    key = next(
+        key
+        for key, register in register_map.items()
+        if register.get("offset") in peripheral.buffers[buffer_ids[1]]
+    )
+    reads = lambda: transport.link_stats[device.id_device]["reads"]  # noqa: E731
+    try:
+        # Nothing is known to be used yet, so every buffer is read.
+        await device.update()
+        assert reads()["full"] == 1
+
+        device.reset_used_registers()
+        device.get_register_value(key)
+        assert transport._plan_buffer_reads(device, buffer_ids) == [buffer_ids[1]]
+        await device.update()
+        assert reads()["partial"] == 1
+        assert reads()["buffers_skipped"] == len(buffer_ids) - 1
+
+        transport._last_full_read[device.id_device] -= local_ble.BLE_FULL_READ_INTERVAL
+        assert transport._plan_buffer_reads(device, buffer_ids) == buffer_ids
+        await device.update()
+        assert reads()["full"] == 2
+    finally:
+        await transport.close()
@@ -0,0 +1,90 @@
+"""Tests for the sensor state."""
+
+from collections import Counter
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.aguaiot.aguaiot import aguaiot
+from custom_components.aguaiot.const import SENSORS
+from custom_components.aguaiot.sensor import AguaIOTHeatingSensor
+
+from .common import API_URL, FakeCloud, cached_device, load_fixture
+
+# Extractor fan speed: raw value times 10 rpm, 50 rpm deadband, 120 s interval.
+EXTRACTOR_FAN = next(
+    sensor for sensor in SENSORS if sensor.key == "giri_estrattore_get"
+)
+EXTRACTOR_FAN_OFFSET = 47
+
+
+def _publish(sensor: AguaIOTHeatingSensor, device, raw_value: int) -> None:
+    """Let the coordinator publish a new extractor fan reading."""
+    device.set_information({EXTRACTOR_FAN_OFFSET: raw_value})
+    sensor.coordinator.data = {device.id_device: device.snapshot}
+
+
+def _extractor_fan_sensor(hass: HomeAssistant):
+    """Return an extractor fan sensor that has written 220 rpm."""
+    client = aguaiot(
+        API_URL, "customer", "email", "password", "uuid", async_client=FakeCloud()
+    )
+    client.load_cached_devices([cached_device(load_fixture("nobis_water"))])
+    device = client.devices[0]
+
+    coordinator = MagicMock(suppressed_writes=Counter(), last_update_success=True)
+    sensor = AguaIOTHeatingSensor(coordinator, device, EXTRACTOR_FAN)
+    _publish(sensor, device, 22)
+    sensor.hass = hass
+    sensor.entity_id = "sensor.stove_extractor_fan"
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._handle_coordinator_update()
+    sensor.async_write_ha_state.reset_mock()
+    return sensor, device
+
+
+async def test_value_comes_from_published_snapshot(hass: HomeAssistant) -> None:
+    """Values the coordinator has not published yet are not shown."""
+    sensor, device = _extractor_fan_sensor(hass)
+
+    device.set_information({EXTRACTOR_FAN_OFFSET: 30})
+
+    assert sensor.native_value == 220
+    _publish(sensor, device, 30)
+    assert sensor.native_value == 300
+
+
+async def test_change_beyond_deadband_bypasses_interval(hass: HomeAssistant) -> None:
+    """A change of at least the deadband is written within the interval."""
+    sensor, device = _extractor_fan_sensor(hass)
+
+    _publish(sensor, device, 30)
+    sensor._handle_coordinator_update()
+
+    sensor.async_write_ha_state.assert_called_once()
+    assert sensor.native_value == 300
+
+
+async def test_small_change_written_after_interval(hass: HomeAssistant) -> None:
+    """A small change within the interval is written once the interval passed."""
+    sensor, device = _extractor_fan_sensor(hass)
+
+    _publish(sensor, device, 23)
+    sensor._handle_coordinator_update()
+
+    sensor.async_write_ha_state.assert_not_called()
+    assert sensor.coordinator.suppressed_writes[sensor.entity_id] == 1
+
+    # No coordinator update follows; the trailing write catches up.
+    sensor._last_write_time -= EXTRACTOR_FAN.min_interval
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=EXTRACTOR_FAN.min_interval + 1)
+    )
+    await hass.async_block_till_done()
+
+    sensor.async_write_ha_state.assert_called_once()
+    assert sensor._last_written == 230
@@ -0,0 +1,44 @@
+"""Tests for the shared register map store."""
+
+import copy
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.aguaiot.storage import RegisterMapStore
+
+from .common import load_fixture
+
+CLOUD_A = "https://cloud-a.example.com"
+CLOUD_B = "https://cloud-b.example.com"
+
+
+async def test_maps_are_kept_per_cloud(hass: HomeAssistant) -> None:
+    """The same map id on two clouds keeps two maps."""
+    store = RegisterMapStore(hass)
+    store.put(CLOUD_A, 1, load_fixture("nobis_water"))
+    store.put(CLOUD_B, 1, load_fixture("mcz"))
+
+    assert store.get(CLOUD_A, 1).keys() == load_fixture("nobis_water").keys()
+    assert store.get(CLOUD_B, 1).keys() == load_fixture("mcz").keys()
+    assert (
+        store.attach(CLOUD_B, [{"id_registers_map": 1}])[0]["register_map"].keys()
+        == load_fixture("mcz").keys()
+    )
+
+
+async def test_changed_definition_replaces_map(hass: HomeAssistant) -> None:
+    """A map with the same keys but another definition is stored again."""
+    store = RegisterMapStore(hass)
+    register_map = load_fixture("nobis_water")
+    store.put(CLOUD_A, 1, register_map)
+
+    # New register values alone do not rewrite the map.
+    with_values = copy.deepcopy(register_map)
+    with_values["giri_estrattore_get"]["value_raw"] = "99"
+    store.put(CLOUD_A, 1, with_values)
+    assert store.get(CLOUD_A, 1) is register_map
+
+    changed = copy.deepcopy(register_map)
+    changed["giri_estrattore_get"]["mask"] = 255
+    store.put(CLOUD_A, 1, changed)
+    assert store.get(CLOUD_A, 1)["giri_estrattore_get"]["mask"] == 255